@@ -0,0 +1,282 @@
+"""Advent of Code 2023 - Command line interface
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from aoc.batch import find_inputs, solve_batch
+from aoc.bench import bench_day, format_bench_result
+from aoc.cache import ParseCache
+from aoc.complexity import measure_complexity
+from aoc.daemon import DEFAULT_SOCKET, request_solve, run_daemon
+from aoc.generators import generate
+from aoc.history import (
+    DEFAULT_HISTORY,
+    append_records,
+    compare,
+    load_records,
+    measure,
+)
+from aoc.runner import format_ns, format_result, run_day
+from aoc.solvers import load_solver, parse_days
+from day_01.main import CHUNK_SIZE, solve_chunked
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    cache = None if args.no_cache else ParseCache()
+    total = 0
+    for day in parse_days(args.days):
+        solver = load_solver(day)
+        result = run_day(solver, solver.directory / args.input, cache)
+        total += result.total
+        print(format_result(result))
+
+    print(f"total {format_ns(total)}")
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    scales = tuple(float(s) for s in args.scales.split(","))
+    for day in parse_days(args.days):
+        for result in bench_day(day, scales, args.seed, args.timeout):
+            print(format_bench_result(result), flush=True)
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    files = find_inputs(args.directory, args.pattern)
+    for record in solve_batch(args.day, files, args.workers, not args.no_cache):
+        print(json.dumps(record), flush=True)
+
+
+def cmd_record(args: argparse.Namespace) -> None:
+    for day in parse_days(args.days):
+        solver = load_solver(day)
+        records = measure(day, solver.directory / args.input, args.repeat)
+        append_records(args.history, records)
+        print(f"day {day:02} recorded {len(records)} runs", flush=True)
+
+
+def cmd_compare(args: argparse.Namespace) -> None:
+    history = load_records(args.history)
+    regressions = 0
+    for day in parse_days(args.days):
+        solver = load_solver(day)
+        current = measure(day, solver.directory / args.input, args.repeat)
+        comparisons = compare(history, current, args.window)
+        if not comparisons:
+            print(f"day {day:02} no baseline")
+        for c in comparisons:
+            regression = c.is_regression(args.margin)
+            regressions += regression
+            print(
+                f"day {day:02} {c.phase:<6}  baseline {format_ns(int(c.baseline)):>10}"
+                f" (n={c.samples})  now {format_ns(int(c.current)):>10}"
+                f"  x{c.ratio:.2f}{'  REGRESSION' if regression else ''}",
+                flush=True,
+            )
+        if args.record:
+            append_records(args.history, current)
+
+    if regressions:
+        sys.exit(1)
+
+
+def cmd_complexity(args: argparse.Namespace) -> None:
+    scales = tuple(float(s) for s in args.scales.split(","))
+    for day in parse_days(args.days):
+        try:
+            fits = measure_complexity(day, scales, args.seed, args.timeout)
+        except ValueError as e:
+            print(f"day {day:02} {e}")
+            continue
+        for fit in fits:
+            largest_size, largest_time = fit.points[-1]
+            print(
+                f"day {day:02} {fit.phase:<6}  {fit.model:<10}  n^{fit.exponent:.2f}"
+                f"  {format_ns(largest_time):>10} at {largest_size} bytes",
+                flush=True,
+            )
+
+
+def cmd_daemon(args: argparse.Namespace) -> None:
+    try:
+        run_daemon(args.socket, args.max_parsed)
+    except RuntimeError as e:
+        sys.exit(str(e))
+
+
+def cmd_client(args: argparse.Namespace) -> None:
+    if args.input == "-":
+        response = request_solve(
+            args.day, args.part, content=sys.stdin.read(), socket_path=args.socket
+        )
+    else:
+        response = request_solve(args.day, args.part, args.input, socket_path=args.socket)
+
+    if not response["ok"]:
+        sys.exit(response["error"])
+    print(response["answer"])
+
+
+def cmd_day1_chunked(args: argparse.Namespace) -> None:
+    if args.chunk_size < 1:
+        sys.exit("--chunk-size must be at least 1 byte")
+    answer_1, answer_2 = solve_chunked(args.input, args.chunk_size, args.workers)
+    print(answer_1, answer_2)
+
+
+def cmd_generate(args: argparse.Namespace) -> None:
+    sys.stdout.write(generate(args.day, args.scale, args.seed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(required=True)
+
+    run_parser = subparsers.add_parser("run", help="solve days and time each phase")
+    run_parser.add_argument("days", help='days to run, e.g. "1-16" or "1,3,5-7"')
+    run_parser.add_argument(
+        "--input", default="input.txt", help="input file name in each day directory"
+    )
+    run_parser.add_argument(
+        "--no-cache", action="store_true", help="always parse, skip the parse cache"
+    )
+    run_parser.set_defaults(func=cmd_run)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="time generated inputs of growing size"
+    )
+    bench_parser.add_argument("days", help='days to run, e.g. "1-16" or "1,3,5-7"')
+    bench_parser.add_argument(
+        "--scales",
+        default="1,10,100",
+        help="increasing input sizes relative to the real input",
+    )
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--timeout", type=float, help="give up on a single input after this many seconds"
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve every input in a directory, one JSON line per file"
+    )
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("directory")
+    batch_parser.add_argument("--pattern", default="*", help="glob for input files")
+    batch_parser.add_argument(
+        "--workers", type=int, help="worker processes, defaults to all cores"
+    )
+    batch_parser.add_argument(
+        "--no-cache", action="store_true", help="always parse, skip the parse cache"
+    )
+    batch_parser.set_defaults(func=cmd_batch)
+
+    complexity_parser = subparsers.add_parser(
+        "complexity", help="fit the growth of each phase over generated inputs"
+    )
+    complexity_parser.add_argument("days", help='days to run, e.g. "1-16" or "1,3,5-7"')
+    complexity_parser.add_argument(
+        "--scales",
+        default="0.25,0.5,1,2,4,8",
+        help="increasing input sizes relative to the real input",
+    )
+    complexity_parser.add_argument("--seed", type=int, default=0)
+    complexity_parser.add_argument(
+        "--timeout", type=float, help="stop growing a day after this many seconds"
+    )
+    complexity_parser.set_defaults(func=cmd_complexity)
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="serve solve requests over a unix socket"
+    )
+    daemon_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    daemon_parser.add_argument(
+        "--max-parsed", type=int, default=32, help="parsed inputs kept in memory"
+    )
+    daemon_parser.set_defaults(func=cmd_daemon)
+
+    client_parser = subparsers.add_parser(
+        "client", help="solve a part with a running daemon"
+    )
+    client_parser.add_argument("day", type=int)
+    client_parser.add_argument("part", type=int, choices=(1, 2))
+    client_parser.add_argument("input", help='input file, "-" sends stdin')
+    client_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    client_parser.set_defaults(func=cmd_client)
+
+    chunked_parser = subparsers.add_parser(
+        "day1-chunked", help="solve both parts of a large day 1 file in parallel chunks"
+    )
+    chunked_parser.add_argument("input", help="calibration document")
+    chunked_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help="bytes per chunk, rounded up to the end of a line",
+    )
+    chunked_parser.add_argument(
+        "--workers", type=int, help="worker processes, defaults to all cores"
+    )
+    chunked_parser.set_defaults(func=cmd_day1_chunked)
+
+    history_parser = argparse.ArgumentParser(add_help=False)
+    history_parser.add_argument("days", help='days to run, e.g. "1-16" or "1,3,5-7"')
+    history_parser.add_argument(
+        "--input", default="input.txt", help="input file name in each day directory"
+    )
+    history_parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per day, each in a fresh process"
+    )
+    history_parser.add_argument(
+        "--history", type=Path, default=DEFAULT_HISTORY, help="JSON lines history file"
+    )
+
+    record_parser = subparsers.add_parser(
+        "record", parents=[history_parser], help="add timings to the history"
+    )
+    record_parser.set_defaults(func=cmd_record)
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        parents=[history_parser],
+        help="flag phases slower than their history, exits with 1 on regressions",
+    )
+    compare_parser.add_argument(
+        "--margin", type=float, default=0.1, help="allowed slowdown, 0.1 is 10%%"
+    )
+    compare_parser.add_argument(
+        "--window", type=int, default=20, help="number of past runs in the baseline"
+    )
+    compare_parser.add_argument(
+        "--record", action="store_true", help="also add the new timings to the history"
+    )
+    compare_parser.set_defaults(func=cmd_compare)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write a generated input to stdout"
+    )
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("--scale", type=float, default=1)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.set_defaults(func=cmd_generate)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
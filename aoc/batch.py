@@ -0,0 +1,58 @@
+"""Advent of Code 2023 - Batch solving of many inputs
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoc.cache import ParseCache
+from aoc.runner import run_day
+from aoc.solvers import load_solver
+
+
+def solve_file(day: int, filename: str, use_cache: bool = True) -> dict[str, Any]:
+    record: dict[str, Any] = {"day": day, "file": filename}
+    try:
+        cache = ParseCache() if use_cache else None
+        result = run_day(load_solver(day), filename, cache)
+    except Exception as e:
+        record["error"] = repr(e)
+        return record
+
+    record["answers"] = list(result.answers)
+    record["timings_ns"] = result.timings
+    return record
+
+
+def find_inputs(directory: str | Path, pattern: str = "*") -> list[Path]:
+    """Input files in the directory, largest first."""
+    files = [p for p in Path(directory).glob(pattern) if p.is_file()]
+    return sorted(files, key=lambda p: p.stat().st_size, reverse=True)
+
+
+def solve_batch(
+    day: int, files: list[Path], workers: int | None = None, use_cache: bool = True
+) -> Iterator[dict[str, Any]]:
+    """Yield results in completion order.
+
+    The pool hands out work in submission order, so submitting the largest
+    files first keeps one big file from being the only thing left running
+    at the end."""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_file, day, str(f), use_cache) for f in files]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,120 @@
+"""Advent of Code 2023 - Benchmarks over generated inputs
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import multiprocessing
+import resource
+import tempfile
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+from aoc.generators import generate
+from aoc.runner import PHASES, format_ns, run_day
+from aoc.solvers import load_solver
+
+SCALES = (1, 10, 100)
+
+
+@dataclass
+class BenchResult:
+    day: int
+    scale: float
+    size: int = 0  # bytes of input
+    status: str = "ok"  # ok, timeout, skipped or the error message
+    timings: dict[str, int] = field(default_factory=dict)  # nanoseconds per phase
+    peak_rss: int = 0  # kilobytes
+
+    @property
+    def total(self) -> int:
+        return sum(self.timings.values())
+
+
+def _solve_in_child(day: int, filename: str, conn: Connection) -> None:
+    try:
+        result = run_day(load_solver(day), filename)
+        conn.send((result.timings, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+def bench_input(day: int, filename: str | Path, timeout: float | None = None) -> BenchResult:
+    """Solve the input in a fresh process so the peak memory is the solver's own."""
+    result = BenchResult(day=day, scale=0)
+
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_solve_in_child, args=(day, str(filename), child_conn)
+    )
+    process.start()
+    child_conn.close()
+
+    if not parent_conn.poll(timeout):
+        process.kill()
+        process.join()
+        result.status = "timeout"
+        return result
+
+    try:
+        message = parent_conn.recv()
+    except EOFError:
+        message = RuntimeError(f"solver exited with code {process.exitcode}")
+    process.join()
+
+    if isinstance(message, Exception):
+        result.status = f"error: {message!r}"
+    else:
+        result.timings, result.peak_rss = message
+    return result
+
+
+def bench_day(
+    day: int,
+    scales: tuple[float, ...] = SCALES,
+    seed: int = 0,
+    timeout: float | None = None,
+) -> list[BenchResult]:
+    results: list[BenchResult] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in scales:
+            if results and results[-1].status in ("timeout", "skipped"):
+                # a larger input will not be any faster
+                results.append(BenchResult(day=day, scale=scale, status="skipped"))
+                continue
+
+            filename = Path(directory) / f"day_{day:02}_x{scale}.txt"
+            filename.write_text(generate(day, scale, seed))
+
+            result = bench_input(day, filename, timeout)
+            result.scale = scale
+            result.size = filename.stat().st_size
+            results.append(result)
+    return results
+
+
+def format_bench_result(result: BenchResult) -> str:
+    prefix = f"day {result.day:02} x{result.scale:<5g}"
+    if result.status != "ok":
+        return f"{prefix}  {result.status}"
+
+    timings = "  ".join(
+        f"{phase} {format_ns(result.timings[phase]):>10}" for phase in PHASES
+    )
+    return (
+        f"{prefix}  {timings}  total {format_ns(result.total):>10}"
+        f"  peak {result.peak_rss / 1024:.1f} MiB"
+    )
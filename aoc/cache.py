@@ -0,0 +1,92 @@
+"""Advent of Code 2023 - On-disk cache of parsed inputs
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from aoc.solvers import Solver
+
+DEFAULT_DIRECTORY = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aoc2023"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ParseCache:
+    """Parsed inputs stored in the compact binary form of each day.
+
+    Entries are keyed by a hash of the input and of the solver source,
+    including the repo modules it uses such as aoc.grid, so changing a
+    solver or the layout of its parsed data invalidates its entries. When the cache grows past
+    max_bytes the least recently used entries are removed."""
+
+    def __init__(
+        self, directory: Path = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def path(self, solver: Solver, filename: str | Path) -> Path:
+        h = hashlib.sha256(solver.version.encode())
+        with open(filename, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                h.update(chunk)
+        return self.directory / f"day_{solver.day:02}-{h.hexdigest()}.bin"
+
+    def parse(self, solver: Solver, filename: str | Path) -> Any:
+        """Parse the input, or load it from the cache if it has been seen before."""
+        if not solver.cacheable:
+            return solver.parse_1(str(filename))
+
+        path = self.path(solver, filename)
+        try:
+            blob = path.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            os.utime(path)  # mark as recently used
+            return solver.load_parsed(blob)
+
+        data = solver.parse_1(str(filename))
+        self.store(path, solver.dump_parsed(data))
+        return data
+
+    def store(self, path: Path, blob: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write and rename so concurrent runs never see half written entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # removed by another process
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,87 @@
+"""Advent of Code 2023 - Empirical complexity of the solvers
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Callable
+
+from aoc.bench import BenchResult, bench_day
+from aoc.runner import PHASES
+
+SCALES = (0.25, 0.5, 1, 2, 4, 8)
+
+MODELS: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^1.5)": lambda n: n**1.5,
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+@dataclass
+class Fit:
+    phase: str
+    model: str  # best fitting entry of MODELS
+    exponent: float  # slope of log time over log size
+    points: list[tuple[int, int]]  # input bytes and nanoseconds
+
+
+def best_model(sizes: list[int], times: list[int]) -> str:
+    """Fit time = c * f(n) for every model in log space and keep the model
+    whose constant c varies the least over the sizes."""
+    errors = {}
+    for name, f in MODELS.items():
+        log_ratios = [math.log(t) - math.log(f(n)) for n, t in zip(sizes, times)]
+        errors[name] = statistics.pvariance(log_ratios)
+    return min(errors, key=errors.__getitem__)
+
+
+def exponent(sizes: list[int], times: list[int]) -> float:
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def fit_results(results: list[BenchResult]) -> list[Fit]:
+    ok = [r for r in results if r.status == "ok"]
+    if len(ok) < 3:
+        raise ValueError(f"need at least three solved sizes, got {len(ok)}")
+
+    sizes = [r.size for r in ok]
+    fits = []
+    for phase in PHASES:
+        times = [max(r.timings[phase], 1) for r in ok]
+        fits.append(
+            Fit(
+                phase=phase,
+                model=best_model(sizes, times),
+                exponent=exponent(sizes, times),
+                points=list(zip(sizes, times)),
+            )
+        )
+    return fits
+
+
+def measure_complexity(
+    day: int,
+    scales: tuple[float, ...] = SCALES,
+    seed: int = 0,
+    timeout: float | None = None,
+) -> list[Fit]:
+    return fit_results(bench_day(day, scales, seed, timeout))
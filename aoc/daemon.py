@@ -0,0 +1,221 @@
+"""Advent of Code 2023 - Warm solver daemon and client
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import socket
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.runner import timed
+from aoc.solvers import DAYS, Solver, load_solver
+
+DEFAULT_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir())) / (
+    "aoc2023.sock"
+)
+MAX_LINE = 256 * 1024 * 1024  # inputs can be sent inline
+
+
+class SolverDaemon:
+    """Answers solve requests with the day modules imported and the most
+    recently parsed inputs kept in memory.
+
+    Requests and responses are JSON objects, one per line:
+    {"day": 7, "part": 1, "path": "/abs/input.txt"} or with "input" holding
+    the input text, answered by {"ok": true, "answer": ..., "cached": ...,
+    "timings_ns": {"parse": ..., "solve": ...}} or {"ok": false, "error": ...}.
+    """
+
+    def __init__(self, max_parsed: int = 32) -> None:
+        self.solvers: dict[int, Solver] = {}
+        self.parsed: OrderedDict[tuple, Any] = OrderedDict()
+        self.max_parsed = max_parsed
+        self.lock = threading.Lock()
+
+    def preload(self, days: list[int]) -> None:
+        for day in days:
+            self.solver(day)
+
+    def solver(self, day: int) -> Solver:
+        with self.lock:
+            if day not in self.solvers:
+                self.solvers[day] = load_solver(day)
+            return self.solvers[day]
+
+    def parsed_input(
+        self, day: int, parse: Callable[[str], Any], request: dict[str, Any]
+    ) -> tuple[Any, int, bool]:
+        """Parsed data, time spent parsing and whether it was already parsed."""
+        content = None
+        if "path" in request:
+            path = Path(request["path"])
+            stat = path.stat()
+            key: tuple = (day, parse, str(path), stat.st_mtime_ns, stat.st_size)
+        elif "input" in request:
+            content = request["input"].encode()
+            key = (day, parse, hashlib.sha256(content).hexdigest())
+        else:
+            raise ValueError('request needs a "path" or an "input"')
+
+        with self.lock:
+            if key in self.parsed:
+                self.parsed.move_to_end(key)
+                return self.parsed[key], 0, True
+
+        if content is None:
+            data, parse_time = timed(parse, str(path))
+        else:
+            # parsers read files, give them one
+            with tempfile.NamedTemporaryFile(suffix=".txt") as f:
+                f.write(content)
+                f.flush()
+                data, parse_time = timed(parse, f.name)
+
+        with self.lock:
+            self.parsed[key] = data
+            while len(self.parsed) > self.max_parsed:
+                self.parsed.popitem(last=False)
+        return data, parse_time, False
+
+    def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        day = int(request["day"])
+        part = int(request["part"])
+        solver = self.solver(day)
+        if part == 1:
+            parse, solve = solver.parse_1, solver.part_1
+        elif part == 2:
+            parse, solve = solver.parse_2, solver.part_2
+        else:
+            raise ValueError(f"part must be 1 or 2, got {part}")
+
+        data, parse_time, cached = self.parsed_input(day, parse, request)
+        answer, solve_time = timed(solve, data)
+        return {
+            "ok": True,
+            "answer": answer,
+            "cached": cached,
+            "timings_ns": {"parse": parse_time, "solve": solve_time},
+        }
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line: bytes | None
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial  # the last request may lack its newline
+                except asyncio.LimitOverrunError:
+                    await skip_line(reader)
+                    line = None
+                if line is None:
+                    response = {"ok": False, "error": f"request longer than {MAX_LINE} bytes"}
+                elif not line:
+                    break
+                else:
+                    try:
+                        # solve in a thread so other connections are still served
+                        response = await asyncio.to_thread(self.solve, json.loads(line))
+                    except Exception as e:
+                        response = {"ok": False, "error": repr(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path: Path = DEFAULT_SOCKET) -> None:
+        if is_serving(socket_path):
+            raise RuntimeError(f"another daemon is serving {socket_path}")
+        socket_path.unlink(missing_ok=True)  # left over from an earlier run
+        server = await asyncio.start_unix_server(
+            self.handle, path=str(socket_path), limit=MAX_LINE
+        )
+
+        # stop on ctrl-c and on a plain kill, so the socket file is removed
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            socket_path.unlink(missing_ok=True)
+
+
+async def skip_line(reader: asyncio.StreamReader) -> None:
+    """Drop the rest of a line longer than the read limit, so the next line
+    is read as the next request."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+def is_serving(socket_path: Path) -> bool:
+    """Whether a daemon answers on the socket, not just a stale socket file."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+def run_daemon(socket_path: Path = DEFAULT_SOCKET, max_parsed: int = 32) -> None:
+    daemon = SolverDaemon(max_parsed)
+    daemon.preload(list(DAYS))
+    try:
+        asyncio.run(daemon.serve(socket_path))
+    except KeyboardInterrupt:
+        pass
+
+
+def request_solve(
+    day: int,
+    part: int,
+    path: str | Path | None = None,
+    content: str | None = None,
+    socket_path: Path = DEFAULT_SOCKET,
+) -> dict[str, Any]:
+    """Send one solve request to a running daemon."""
+    request: dict[str, Any] = {"day": day, "part": part}
+    if path is not None:
+        request["path"] = str(Path(path).resolve())  # the daemon has its own cwd
+    else:
+        request["input"] = content
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(socket_path))
+        s.sendall(json.dumps(request).encode() + b"\n")
+        with s.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("the daemon closed the connection without answering")
+    return json.loads(line)
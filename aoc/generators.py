@@ -0,0 +1,381 @@
+"""Advent of Code 2023 - Synthetic input generators
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import math
+from random import Random
+from typing import Callable
+
+from day_13.main import find_reflects_horizontal, find_reflects_horizontal_smudge, transpose
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+DIGITS_ALPHA = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def day_01(rng: Random, lines: int = 1000) -> str:
+    rows = []
+    for _ in range(lines):
+        parts = [str(rng.randint(1, 9))]  # part 1 needs at least one digit
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.4:
+                parts.append("".join(rng.choices(LETTERS, k=rng.randint(1, 6))))
+            elif kind < 0.7:
+                parts.append(rng.choice(DIGITS_ALPHA))
+            else:
+                parts.append(str(rng.randint(1, 9)))
+        rng.shuffle(parts)
+        rows.append("".join(parts))
+    return "\n".join(rows) + "\n"
+
+
+def day_02(rng: Random, games: int = 100) -> str:
+    rows = []
+    for n in range(1, games + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            reveals.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        rows.append(f"Game {n}: " + "; ".join(reveals))
+    return "\n".join(rows) + "\n"
+
+
+def day_03(rng: Random, rows: int = 140, width: int = 140) -> str:
+    grid = [["."] * width for _ in range(rows)]
+    for y in range(rows):
+        x = 0
+        while x < width:
+            r = rng.random()
+            if r < 0.08:
+                number = str(rng.randint(1, 999))
+                for c in number[: width - x]:
+                    grid[y][x] = c
+                    x += 1
+            elif r < 0.10:
+                grid[y][x] = rng.choice("*#+$/@%=&-")
+            x += 1
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def day_04(rng: Random, cards: int = 200, winning: int = 10, mine: int = 25) -> str:
+    rows = []
+    for n in range(1, cards + 1):
+        # cards can not win copies of cards past the end of the table
+        matches = min(int(rng.expovariate(0.5)), winning, cards - n)
+        numbers = rng.sample(range(1, 100), winning + mine - matches)
+        winning_numbers = numbers[:winning]
+        my_numbers = numbers[winning:] + winning_numbers[:matches]
+        rng.shuffle(my_numbers)
+        rows.append(
+            f"Card {n:>3}: "
+            + " ".join(f"{w:>2}" for w in winning_numbers)
+            + " | "
+            + " ".join(f"{m:>2}" for m in my_numbers)
+        )
+    return "\n".join(rows) + "\n"
+
+
+ALMANAC_MAPS = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+def day_05(rng: Random, seeds: int = 20, ranges: int = 40) -> str:
+    limit = 2**32
+    seed_values = []
+    for _ in range(seeds // 2):
+        start = rng.randrange(limit)
+        seed_values += [start, rng.randint(1, min(limit - start, 2**28))]
+
+    rows = ["seeds: " + " ".join(str(s) for s in seed_values)]
+    for name in ALMANAC_MAPS:
+        # sources split the whole range without overlaps, like the real inputs
+        breakpoints = sorted(set(rng.sample(range(1, limit), ranges - 1)))
+        rows += ["", f"{name} map:"]
+        for start, stop in zip([0] + breakpoints, breakpoints + [limit]):
+            length = stop - start
+            rows.append(f"{rng.randrange(limit - length + 1)} {start} {length}")
+    return "\n".join(rows) + "\n"
+
+
+def day_06(rng: Random, races: int = 4) -> str:
+    times = []
+    distances = []
+    for _ in range(races):
+        time = rng.randint(10, 99)
+        hold = rng.randint(1, time - 1)
+        times.append(time)
+        distances.append(hold * (time - hold) - 1)
+    return (
+        "Time:     " + "".join(f"{t:>7}" for t in times) + "\n"
+        "Distance: " + "".join(f"{d:>7}" for d in distances) + "\n"
+    )
+
+
+def day_07(rng: Random, hands: int = 1000) -> str:
+    rows = []
+    for _ in range(hands):
+        hand = "".join(rng.choices("AKQJT98765432", k=5))
+        rows.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(rows) + "\n"
+
+
+def _node_name(n: int) -> str:
+    name = ""
+    while True:
+        n, r = divmod(n, 26)
+        name += LETTERS[r].upper()
+        if not n:
+            break
+    # A and Z are reserved as the last letter of start and end nodes
+    return name.ljust(3, "A") + "B"
+
+
+def day_08(rng: Random, nodes: int = 750, ghosts: int = 6, directions: int = 280) -> str:
+    """Every ghost walks its own chain from an A node to a Z node, the Z node
+    leads back into the chain. The first chain goes from AAA to ZZZ."""
+    rows = ["".join(rng.choices("LR", k=directions)), ""]
+    counter = 0
+    for ghost in range(ghosts):
+        length = max(3, nodes // ghosts + rng.randint(-10, 10))
+        chain = [_node_name(counter + n) for n in range(length)]
+        counter += length
+        if ghost == 0:
+            chain[0], chain[-1] = "AAA", "ZZZ"
+        else:
+            chain[0] = chain[0][:-1] + "A"
+            chain[-1] = chain[-1][:-1] + "Z"
+        for n, node in enumerate(chain):
+            following = chain[n + 1] if n + 1 < length else chain[1]
+            rows.append(f"{node} = ({following}, {following})")
+    return "\n".join(rows) + "\n"
+
+
+def day_09(rng: Random, sequences: int = 200, length: int = 21) -> str:
+    rows = []
+    for _ in range(sequences):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 8))]
+        rows.append(
+            " ".join(
+                str(sum(c * x**n for n, c in enumerate(coefficients)))
+                for x in range(length)
+            )
+        )
+    return "\n".join(rows) + "\n"
+
+
+PIPES = {
+    frozenset("EW"): "-",
+    frozenset("NS"): "|",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def _heading(a: tuple[int, int], b: tuple[int, int]) -> str:
+    (ax, ay), (bx, by) = a, b
+    if ay == by:
+        return "E" if bx > ax else "W"
+    return "S" if by > ay else "N"
+
+
+def day_10(rng: Random, rows: int = 140, width: int = 140) -> str:
+    """A serpentine loop with random turns surrounded by random pipe junk.
+    The passes are at least one row apart, so every other gap is inside."""
+    rows = max(rows, 6)
+    width = max(width, 6)
+    grid = [[rng.choice(".|-LJ7F") for _ in range(width)] for _ in range(rows)]
+
+    # the loop uses rows 1 to height - 2 and columns 1 to width - 2, it
+    # starts at the top left, snakes down and returns along the left column
+    top, left = 1, 1
+    bottom, right = rows - 2, width - 2
+    passes = [top]
+    while passes[-1] + 2 <= bottom:
+        passes.append(min(passes[-1] + rng.randint(2, 3), bottom))
+    if len(passes) % 2:
+        passes.pop()  # the last pass has to go back to the left
+    slack = max(0, min(2, (right - left - 3) // 2))
+
+    path: list[tuple[int, int]] = []
+    x = left
+    for n, (y, following) in enumerate(zip(passes, passes[1:] + [None])):
+        if following is None:
+            turn = left
+        elif n % 2 == 0:
+            turn = rng.randint(right - slack, right)
+        else:
+            turn = rng.randint(left + 1, left + 1 + slack)
+        step = 1 if turn > x else -1
+        path += [(column, y) for column in range(x, turn, step)]
+        x = turn
+        if following is not None:
+            path += [(x, row) for row in range(y, following)]
+    path += [(left, row) for row in range(passes[-1], top, -1)]
+
+    for previous, point, following in zip(path[-1:] + path[:-1], path, path[1:] + path[:1]):
+        x, y = point
+        grid[y][x] = PIPES[frozenset(_heading(point, previous) + _heading(point, following))]
+    grid[top][left] = "S"
+
+    # shoelace and Pick's theorem give the number of tiles inside the loop
+    area = abs(sum(ax * by - bx * ay for (ax, ay), (bx, by) in zip(path, path[1:] + path[:1]))) // 2
+    assert area - len(path) // 2 + 1 > 0
+
+    # no junk may look connected to the start
+    grid[top - 1][left] = "."
+    grid[top][left - 1] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def day_11(rng: Random, rows: int = 140, width: int = 140, density: float = 0.025) -> str:
+    empty_rows = set(rng.sample(range(rows), rows // 15))
+    empty_cols = set(rng.sample(range(width), width // 15))
+    grid = []
+    for y in range(rows):
+        grid.append(
+            "".join(
+                "#"
+                if y not in empty_rows and x not in empty_cols and rng.random() < density
+                else "."
+                for x in range(width)
+            )
+        )
+    return "\n".join(grid) + "\n"
+
+
+def day_12(rng: Random, rows: int = 1000) -> str:
+    result = []
+    for _ in range(rows):
+        springs = "".join(rng.choices(".#", k=rng.randint(5, 20)))
+        counts = [len(group) for group in springs.split(".") if group]
+        if not counts:
+            springs = "#" + springs[1:]
+            counts = [len(group) for group in springs.split(".") if group]
+        unknown = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        result.append(f"{unknown} {','.join(str(c) for c in counts)}")
+    return "\n".join(result) + "\n"
+
+
+def day_13(rng: Random, patterns: int = 100) -> str:
+    """Every pattern mirrors exactly along one line for part 1 and along
+    another line with a single smudge for part 2."""
+    result: list[str] = []
+    while len(result) < patterns:
+        size = rng.randint(7, 17)
+        width = rng.randint(7, 17)
+        mirror, smudged = rng.sample(range(1, size), 2)
+
+        # rows that either line mirrors onto each other are the same row
+        group = list(range(size))
+        for line in (mirror, smudged):
+            for n in range(min(line, size - line)):
+                kept, merged = group[line - 1 - n], group[line + n]
+                group = [kept if g == merged else g for g in group]
+        rows = {g: "".join(rng.choices(".#", k=width)) for g in set(group)}
+        pattern = [rows[g] for g in group]
+
+        # a smudge outside the rows the part 1 line mirrors leaves that line
+        # intact and makes the other line one cell short of a reflection
+        reach = min(mirror, size - mirror)
+        smudged_reach = min(smudged, size - smudged)
+        candidates = [
+            y
+            for y in range(smudged - smudged_reach, smudged + smudged_reach)
+            if not mirror - reach <= y < mirror + reach
+        ]
+        if not candidates:
+            continue
+        y = rng.choice(candidates)
+        x = rng.randrange(width)
+        pattern[y] = pattern[y][:x] + ("#" if pattern[y][x] == "." else ".") + pattern[y][x + 1 :]
+        if rng.random() < 0.5:
+            pattern = transpose(pattern)
+
+        # the solver looks at rows first and then at columns
+        if not (find_reflects_horizontal(pattern) or find_reflects_horizontal(transpose(pattern))):
+            continue
+        if not (
+            find_reflects_horizontal_smudge(pattern)
+            or find_reflects_horizontal_smudge(transpose(pattern))
+        ):
+            continue
+        result.append("\n".join(pattern))
+    return "\n\n".join(result) + "\n"
+
+
+def day_14(rng: Random, rows: int = 100, width: int = 100) -> str:
+    grid = ["".join(rng.choices(".O#", weights=(70, 20, 10), k=width)) for _ in range(rows)]
+    return "\n".join(grid) + "\n"
+
+
+def day_15(rng: Random, steps: int = 4000, labels: int = 500) -> str:
+    names = ["".join(rng.choices(LETTERS, k=rng.randint(2, 6))) for _ in range(labels)]
+    result = []
+    for _ in range(steps):
+        label = rng.choice(names)
+        if rng.random() < 0.4:
+            result.append(f"{label}-")
+        else:
+            result.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(result)
+
+
+def day_16(rng: Random, size: int = 110) -> str:
+    grid = ["".join(rng.choices(".|-/\\", weights=(90, 2.5, 2.5, 2.5, 2.5), k=size)) for _ in range(size)]
+    return "\n".join(grid) + "\n"
+
+
+def _side(base: int, scale: float) -> int:
+    """Grow both sides of a grid so the number of cells grows with scale."""
+    return max(1, round(base * math.sqrt(scale)))
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+# day -> generator of an input of roughly "scale" times the size of the real input
+GENERATORS: dict[int, Callable[[Random, float], str]] = {
+    1: lambda rng, scale: day_01(rng, lines=_count(1000, scale)),
+    2: lambda rng, scale: day_02(rng, games=_count(100, scale)),
+    3: lambda rng, scale: day_03(rng, rows=_side(140, scale), width=_side(140, scale)),
+    4: lambda rng, scale: day_04(rng, cards=_count(200, scale)),
+    5: lambda rng, scale: day_05(rng, seeds=2 * _count(10, scale), ranges=_count(40, scale)),
+    6: lambda rng, scale: day_06(rng, races=_count(4, scale)),
+    7: lambda rng, scale: day_07(rng, hands=_count(1000, scale)),
+    8: lambda rng, scale: day_08(rng, nodes=_count(750, scale)),
+    9: lambda rng, scale: day_09(rng, sequences=_count(200, scale)),
+    10: lambda rng, scale: day_10(rng, rows=_side(140, scale), width=_side(140, scale)),
+    11: lambda rng, scale: day_11(rng, rows=_side(140, scale), width=_side(140, scale)),
+    12: lambda rng, scale: day_12(rng, rows=_count(1000, scale)),
+    13: lambda rng, scale: day_13(rng, patterns=_count(100, scale)),
+    14: lambda rng, scale: day_14(rng, rows=_side(100, scale), width=_side(100, scale)),
+    15: lambda rng, scale: day_15(rng, steps=_count(4000, scale)),
+    16: lambda rng, scale: day_16(rng, size=_side(110, scale)),
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"no generator for day {day}")
+    return GENERATORS[day](Random(seed), scale)
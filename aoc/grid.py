@@ -0,0 +1,125 @@
+"""Advent of Code 2023 - Compact character grid
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import struct
+from typing import Iterable, Iterator
+
+Point = tuple[int, int]
+
+
+class Grid:
+    """A rectangular grid of one byte cells stored row by row in a bytearray.
+
+    Cells are read and written as one character strings, grid[x, y]."""
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: bytearray) -> None:
+        assert len(cells) == width * height
+        self.width = width
+        self.height = height
+        self.cells = cells
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: str = ".") -> "Grid":
+        return cls(width, height, bytearray(value.encode() * (width * height)))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[bytes | str]) -> "Grid":
+        cells = bytearray()
+        width = 0
+        height = 0
+        for line in lines:
+            if isinstance(line, str):
+                line = line.encode()
+            if not height:
+                width = len(line)
+            elif len(line) != width:
+                raise ValueError(f"expected row of width {width}, got {len(line)}")
+            cells += line
+            height += 1
+
+        return cls(width, height, cells)
+
+    def to_bytes(self) -> bytes:
+        return struct.pack("<II", self.width, self.height) + self.cells
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Grid":
+        width, height = struct.unpack_from("<II", data)
+        return cls(width, height, bytearray(data[struct.calcsize("<II") :]))
+
+    def __getitem__(self, point: Point) -> str:
+        x, y = point
+        return chr(self.cells[y * self.width + x])
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        x, y = point
+        self.cells[y * self.width + x] = ord(value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.rows())
+
+    def in_bounds(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x :: self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def find(self, value: str) -> Point:
+        index = self.cells.find(value.encode())
+        if index == -1:
+            raise ValueError(f"{value} not in grid")
+        return index % self.width, index // self.width
+
+    def find_all(self, value: str) -> Iterator[Point]:
+        needle = value.encode()
+        index = self.cells.find(needle)
+        while index != -1:
+            yield index % self.width, index // self.width
+            index = self.cells.find(needle, index + 1)
+
+    def count(self, value: str) -> int:
+        return self.cells.count(value.encode())
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells[:])
+
+    def transpose(self) -> "Grid":
+        cells = bytearray(len(self.cells))
+        for x in range(self.width):
+            cells[x * self.height : (x + 1) * self.height] = self.cells[x :: self.width]
+        return Grid(self.height, self.width, cells)
+
+    def rotate_cw(self) -> "Grid":
+        """Rotate clockwise, the bottom of each column becomes the start of a row."""
+        cells = bytearray(len(self.cells))
+        for x in range(self.width):
+            cells[x * self.height : (x + 1) * self.height] = self.cells[x :: self.width][::-1]
+        return Grid(self.height, self.width, cells)
@@ -0,0 +1,168 @@
+"""Advent of Code 2023 - Benchmark history and regression detection
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from aoc.bench import bench_input
+from aoc.runner import PHASES
+from aoc.solvers import ROOT
+
+DEFAULT_HISTORY = Path("bench_history.jsonl")
+
+
+def machine_info() -> dict[str, Any]:
+    return {
+        "node": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def machine_id(machine: dict[str, Any]) -> tuple:
+    """Timings are only comparable on the same machine."""
+    return (machine["node"], machine["system"], machine["machine"], machine["cpus"])
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return revision + ("-dirty" if dirty else "")
+
+
+def input_hash(filename: str | Path) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+
+def measure(day: int, filename: str | Path, repeat: int) -> list[dict[str, Any]]:
+    """Solve the input repeat times, each in a fresh process so caches such as
+    functools.cache in day 12 do not carry over between runs."""
+    revision = git_revision()
+    machine = machine_info()
+    digest = input_hash(filename)
+
+    records = []
+    for _ in range(repeat):
+        result = bench_input(day, filename)
+        if result.status != "ok":
+            raise RuntimeError(f"day {day} failed: {result.status}")
+        records.append(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "revision": revision,
+                "machine": machine,
+                "day": day,
+                "input": digest,
+                "timings_ns": result.timings,
+                "peak_rss_kb": result.peak_rss,
+            }
+        )
+    return records
+
+
+def append_records(path: Path, records: Iterable[dict[str, Any]]) -> None:
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@dataclass
+class Comparison:
+    day: int
+    phase: str
+    baseline: float  # median nanoseconds
+    baseline_stdev: float
+    current: float  # median nanoseconds
+    samples: int  # number of baseline samples
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def is_regression(self, margin: float) -> bool:
+        """Slower by more than the margin and by more than the normal noise."""
+        return (
+            self.current > self.baseline * (1 + margin)
+            and self.current - self.baseline > 2 * self.baseline_stdev
+        )
+
+
+def compare(
+    history: list[dict[str, Any]], current: list[dict[str, Any]], window: int = 20
+) -> list[Comparison]:
+    """Compare the median of the current runs of each phase with the median
+    of the last window runs of the same day and input on the same machine."""
+    if not current:
+        return []
+
+    first = current[0]
+    baseline_runs = [
+        r
+        for r in history
+        if r["day"] == first["day"]
+        and r["input"] == first["input"]
+        and machine_id(r["machine"]) == machine_id(first["machine"])
+    ][-window:]
+    if not baseline_runs:
+        return []
+
+    comparisons = []
+    for phase in PHASES:
+        baseline = [r["timings_ns"][phase] for r in baseline_runs]
+        comparisons.append(
+            Comparison(
+                day=first["day"],
+                phase=phase,
+                baseline=statistics.median(baseline),
+                baseline_stdev=statistics.stdev(baseline) if len(baseline) > 1 else 0,
+                current=statistics.median(r["timings_ns"][phase] for r in current),
+                samples=len(baseline),
+            )
+        )
+    return comparisons
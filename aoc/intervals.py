@@ -0,0 +1,249 @@
+"""Advent of Code 2023 - Sets of integer intervals
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+Interval = tuple[int, int]  # start and stop, stop excluded
+Piece = tuple[int, int, int]  # start, stop and the offset added inside
+
+
+class IntervalSet:
+    """Integers as sorted, non-overlapping and non-touching half open
+    intervals, kept in two arrays of 64 bit starts and stops."""
+
+    __slots__ = ("starts", "stops")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.starts = array("q")
+        self.stops = array("q")
+        for start, stop in sorted(intervals):
+            if start >= stop:
+                continue
+            if self.stops and start <= self.stops[-1]:
+                if stop > self.stops[-1]:
+                    self.stops[-1] = stop
+            else:
+                self.starts.append(start)
+                self.stops.append(stop)
+
+    @classmethod
+    def _from_arrays(cls, starts: array, stops: array) -> "IntervalSet":
+        """Arrays already sorted and apart, skipping normalization"""
+        result = cls.__new__(cls)
+        result.starts = starts
+        result.stops = stops
+        return result
+
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[Interval]) -> "IntervalSet":
+        result = cls._from_arrays(array("q"), array("q"))
+        for start, stop in intervals:
+            result.starts.append(start)
+            result.stops.append(stop)
+        return result
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.stops)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect_right(self.starts, x) - 1
+        return i >= 0 and x < self.stops[i]
+
+    def size(self) -> int:
+        """Number of integers in the set"""
+        return sum(self.stops) - sum(self.starts)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        def overlaps() -> Iterator[Interval]:
+            i = j = 0
+            while i < len(self) and j < len(other):
+                start = max(self.starts[i], other.starts[j])
+                stop = min(self.stops[i], other.stops[j])
+                if start < stop:
+                    yield start, stop
+                if self.stops[i] < other.stops[j]:
+                    i += 1
+                else:
+                    j += 1
+
+        return IntervalSet._from_sorted(overlaps())
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        def remainders() -> Iterator[Interval]:
+            j = 0
+            for start, stop in self:
+                while j < len(other) and other.stops[j] <= start:
+                    j += 1
+
+                position = start
+                k = j
+                while k < len(other) and other.starts[k] < stop:
+                    if position < other.starts[k]:
+                        yield position, other.starts[k]
+                    position = max(position, other.stops[k])
+                    k += 1
+                if position < stop:
+                    yield position, stop
+
+        return IntervalSet._from_sorted(remainders())
+
+    def clip(self, start: int, stop: int) -> "IntervalSet":
+        """Intersection with the single interval [start, stop)"""
+        if start >= stop:
+            return IntervalSet()
+
+        first = bisect_right(self.stops, start)
+        last = bisect_left(self.starts, stop)
+        starts = self.starts[first:last]
+        stops = self.stops[first:last]
+        if starts:
+            starts[0] = max(starts[0], start)
+            stops[-1] = min(stops[-1], stop)
+        return IntervalSet._from_arrays(starts, stops)
+
+    def shift(self, offset: int) -> "IntervalSet":
+        return IntervalSet._from_arrays(
+            array("q", [s + offset for s in self.starts]),
+            array("q", [s + offset for s in self.stops]),
+        )
+
+    def map_pieces(self, pieces: Iterable[Piece]) -> "IntervalSet":
+        """Image of the set when integers inside a piece get its offset added
+        and all others stay put. Pieces must not overlap.
+
+        The set and the sorted pieces are swept together in one pass."""
+        pieces = sorted(pieces)
+
+        result: list[Interval] = []
+        i = 0
+        for start, stop in self:
+            # pieces ending before this interval end before all the next ones too
+            while i < len(pieces) and pieces[i][1] <= start:
+                i += 1
+
+            position = start
+            j = i
+            while position < stop:
+                if j == len(pieces) or pieces[j][0] >= stop:
+                    result.append((position, stop))
+                    break
+
+                piece_start, piece_stop, offset = pieces[j]
+                if position < piece_start:
+                    result.append((position, piece_start))
+                    position = piece_start
+
+                end = min(stop, piece_stop)
+                result.append((position + offset, end + offset))
+                position = end
+                j += 1
+
+        return IntervalSet(result)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def main() -> None:
+    empty = IntervalSet()
+    lhs = IntervalSet([(10, 18)])
+    rhs = IntervalSet([(1, 14)])
+    several = IntervalSet([(0, 5), (10, 15), (20, 25)])
+
+    # normalization: sorted, empty intervals dropped, overlapping and
+    # touching intervals merged
+    assert list(IntervalSet([(20, 25), (0, 5), (3, 3), (10, 15)])) == list(several)
+    assert IntervalSet([(0, 5), (5, 8), (7, 12)]) == IntervalSet([(0, 12)])
+    assert IntervalSet([(5, 5), (9, 2)]) == empty
+    assert len(several) == 3 and len(empty) == 0
+
+    # membership, in gaps and at the edges
+    assert 0 in several and 4 in several and 5 not in several
+    assert 9 not in several and 10 in several and 14 in several
+    assert -1 not in several and 25 not in several and 0 not in empty
+
+    assert several.size() == 15 and empty.size() == 0
+
+    # union
+    assert lhs | rhs == IntervalSet([(1, 18)])
+    assert several | IntervalSet([(5, 10)]) == IntervalSet([(0, 15), (20, 25)])
+    assert several | empty == several and empty | several == several
+
+    # intersection
+    assert lhs & rhs == IntervalSet([(10, 14)])
+    assert several & IntervalSet([(3, 12), (14, 22)]) == IntervalSet(
+        [(3, 5), (10, 12), (14, 15), (20, 22)]
+    )
+    assert several & IntervalSet([(5, 10), (15, 20)]) == empty
+    assert several & empty == empty
+
+    # difference
+    assert lhs - rhs == IntervalSet([(14, 18)])
+    assert rhs - lhs == IntervalSet([(1, 10)])
+    assert IntervalSet([(1, 20)]) - IntervalSet([(10, 18)]) == IntervalSet(
+        [(1, 10), (18, 20)]
+    )
+    assert several - IntervalSet([(2, 3), (4, 22)]) == IntervalSet(
+        [(0, 2), (3, 4), (22, 25)]
+    )
+    assert several - empty == several and empty - several == empty
+    assert several - several == empty
+
+    # clip
+    assert several.clip(3, 22) == IntervalSet([(3, 5), (10, 15), (20, 22)])
+    assert several.clip(5, 10) == empty
+    assert several.clip(12, 12) == empty and several.clip(13, 11) == empty
+    assert several.clip(-5, 50) == several
+    assert empty.clip(0, 10) == empty
+
+    # shift
+    assert lhs.shift(-10) == IntervalSet([(0, 8)])
+    assert several.shift(5) == IntervalSet([(5, 10), (15, 20), (25, 30)])
+    assert empty.shift(3) == empty
+
+    # map_pieces
+    assert several.map_pieces([]) == several
+    assert several.map_pieces([(3, 12, 100)]) == IntervalSet(
+        [(0, 3), (12, 15), (20, 25), (103, 105), (110, 112)]
+    )
+    # pieces in any order, images merge with untouched intervals
+    assert IntervalSet([(0, 10)]).map_pieces([(5, 10, -5), (0, 5, 5)]) == IntervalSet(
+        [(0, 10)]
+    )
+    assert IntervalSet([(0, 4)]).map_pieces([(2, 4, 2)]) == IntervalSet(
+        [(0, 2), (4, 6)]
+    )
+    assert empty.map_pieces([(0, 10, 1)]) == empty
+
+
+if __name__ == "__main__":
+    main()
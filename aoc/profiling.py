@@ -0,0 +1,84 @@
+"""Advent of Code 2023 - Profiling hooks
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import cProfile
+import functools
+import os
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+PROFILE_ENV = "AOC_PROFILE"  # cpu or mem
+TOP_ENV = "AOC_PROFILE_TOP"  # number of lines in memory reports
+DEFAULT_TOP = 25
+
+
+def is_profiling() -> bool:
+    return bool(os.environ.get(PROFILE_ENV, ""))
+
+
+def instrument(
+    func: Callable[..., Any], filename: str | Path, phase: str
+) -> Callable[..., Any]:
+    """Wrap a phase in a profiler if asked for by the environment.
+
+    The profile is written next to the input, e.g. input.txt.part_1.pstats."""
+    mode = os.environ.get(PROFILE_ENV, "")
+    if not mode:
+        return func
+    if mode == "cpu":
+        return profile_cpu(func, Path(f"{filename}.{phase}.pstats"))
+    if mode == "mem":
+        top = int(os.environ.get(TOP_ENV, DEFAULT_TOP))
+        return profile_memory(func, Path(f"{filename}.{phase}.tracemalloc.txt"), top)
+    raise ValueError(f'unknown {PROFILE_ENV} "{mode}", expected "cpu" or "mem"')
+
+
+def profile_cpu(func: Callable[..., Any], output: Path) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> Any:
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            profiler.dump_stats(output)
+
+    return wrapper
+
+
+def profile_memory(
+    func: Callable[..., Any], output: Path, top: int = DEFAULT_TOP
+) -> Callable[..., Any]:
+    """Write the peak and the top allocations still alive when the phase ends."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> Any:
+        tracemalloc.start()
+        try:
+            result = func(*args)
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        lines = [f"current {current} B, peak {peak} B"]
+        lines += [str(stat) for stat in snapshot.statistics("lineno")[:top]]
+        output.write_text("\n".join(lines) + "\n")
+        return result
+
+    return wrapper
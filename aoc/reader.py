@@ -0,0 +1,39 @@
+"""Advent of Code 2023 - Memory mapped input reading
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator
+
+
+def read_lines(filename: str | Path) -> Iterator[bytes]:
+    """Yield the stripped lines of a file.
+
+    The file is memory mapped and only the current line is copied out of
+    the map, so the whole input is never held in memory as Python objects."""
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # empty files can not be mapped
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mm[start:end].strip()
+                start = end + 1
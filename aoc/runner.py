@@ -0,0 +1,90 @@
+"""Advent of Code 2023 - Timed runner
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from aoc.cache import ParseCache
+from aoc.profiling import instrument, is_profiling
+from aoc.solvers import Solver
+
+PHASES = ("parse", "part_1", "part_2")
+
+
+@dataclass
+class DayResult:
+    day: int
+    answers: tuple[int, int]
+    timings: dict[str, int] = field(default_factory=dict)  # nanoseconds per phase
+
+    @property
+    def total(self) -> int:
+        return sum(self.timings.values())
+
+
+def timed(func: Callable[..., Any], *args: Any) -> tuple[Any, int]:
+    start = perf_counter_ns()
+    result = func(*args)
+    return result, perf_counter_ns() - start
+
+
+def run_day(
+    solver: Solver, filename: str | Path, cache: ParseCache | None = None
+) -> DayResult:
+    filename = str(filename)
+
+    # a cache hit would profile loading the cache instead of the parser
+    if cache is not None and not is_profiling():
+        parse = instrument(cache.parse, filename, "parse")
+        data_1, parse_time = timed(parse, solver, filename)
+    else:
+        parse = instrument(solver.parse_1, filename, "parse")
+        data_1, parse_time = timed(parse, filename)
+    if solver.shared_parse:
+        data_2 = data_1
+    else:
+        # days split over two modules parse twice, both count towards parsing
+        parse_2 = instrument(solver.parse_2, filename, "parse_2")
+        data_2, parse_2_time = timed(parse_2, filename)
+        parse_time += parse_2_time
+
+    part_1 = instrument(solver.part_1, filename, "part_1")
+    answer_1, part_1_time = timed(part_1, data_1)
+    part_2 = instrument(solver.part_2, filename, "part_2")
+    answer_2, part_2_time = timed(part_2, data_2)
+
+    return DayResult(
+        day=solver.day,
+        answers=(answer_1, answer_2),
+        timings={"parse": parse_time, "part_1": part_1_time, "part_2": part_2_time},
+    )
+
+
+def format_ns(ns: int) -> str:
+    if ns >= 1_000_000_000:
+        return f"{ns / 1_000_000_000:.2f} s"
+    if ns >= 1_000_000:
+        return f"{ns / 1_000_000:.2f} ms"
+    return f"{ns / 1_000:.2f} us"
+
+
+def format_result(result: DayResult) -> str:
+    timings = "  ".join(
+        f"{phase} {format_ns(result.timings[phase]):>10}" for phase in PHASES
+    )
+    answers = " ".join(str(a) for a in result.answers)
+    return f"day {result.day:02}  {timings}  total {format_ns(result.total):>10}  {answers}"
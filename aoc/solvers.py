@@ -0,0 +1,134 @@
+"""Advent of Code 2023 - Solver registry
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import importlib
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# day -> (module with part 1, module with part 2, name of the parse function)
+DAYS: dict[int, tuple[str, str, str]] = {
+    1: ("day_01.main", "day_01.main", "parse_data"),
+    2: ("day_02.main", "day_02.main", "parse_games"),
+    3: ("day_03.main", "day_03.main", "parse_schema"),
+    4: ("day_04.main", "day_04.main", "parse_numbers"),
+    5: ("day_05.main_1", "day_05.main_2", "parse_data"),
+    6: ("day_06.main", "day_06.main", "parse_data"),
+    7: ("day_07.main", "day_07.main_2", "parse_data"),
+    8: ("day_08.main", "day_08.main", "parse_data"),
+    9: ("day_09.main", "day_09.main", "parse_data"),
+    10: ("day_10.main", "day_10.main", "parse_data"),
+    11: ("day_11.main", "day_11.main", "parse_data"),
+    12: ("day_12.main", "day_12.main", "parse_data"),
+    13: ("day_13.main", "day_13.main", "parse_data"),
+    14: ("day_14.main", "day_14.main", "read_input"),
+    15: ("day_15.main", "day_15.main", "read_input"),
+    16: ("day_16.main", "day_16.main", "read_input"),
+}
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    parse_1: Callable[[str], Any]
+    part_1: Callable[[Any], int]
+    parse_2: Callable[[str], Any]
+    part_2: Callable[[Any], int]
+    version: str = ""  # hash of the solver source and the repo modules it uses
+    # optional compact binary form of the parsed input
+    dump_parsed: Callable[[Any], bytes] | None = None
+    load_parsed: Callable[[bytes], Any] | None = None
+
+    @property
+    def directory(self) -> Path:
+        return ROOT / f"day_{self.day:02}"
+
+    @property
+    def shared_parse(self) -> bool:
+        """Both parts use the same parsed data."""
+        return self.parse_1 is self.parse_2
+
+    @property
+    def cacheable(self) -> bool:
+        return self.shared_parse and self.dump_parsed is not None
+
+
+def source_files(modules: list[ModuleType]) -> list[Path]:
+    """Files of the modules and of every module from this repo they use,
+    such as aoc.grid whose to_bytes layout ends up in cached entries."""
+    files: dict[str, Path] = {}
+    pending = list(modules)
+    while pending:
+        module = pending.pop()
+        if module.__name__ in files:
+            continue
+        files[module.__name__] = Path(module.__file__)
+
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                used = value
+            elif isinstance(getattr(value, "__module__", None), str):
+                used = sys.modules.get(value.__module__)
+            else:
+                continue
+            filename = getattr(used, "__file__", None)
+            if filename and Path(filename).resolve().is_relative_to(ROOT):
+                pending.append(used)
+
+    return [files[name] for name in sorted(files)]
+
+
+def load_solver(day: int) -> Solver:
+    if day not in DAYS:
+        raise ValueError(f"no solver for day {day}")
+
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    module_1_name, module_2_name, parse_name = DAYS[day]
+    module_1 = importlib.import_module(module_1_name)
+    module_2 = importlib.import_module(module_2_name)
+
+    version = hashlib.sha256()
+    for filename in source_files([module_1, module_2]):
+        version.update(filename.read_bytes())
+
+    return Solver(
+        day=day,
+        parse_1=getattr(module_1, parse_name),
+        part_1=module_1.part_1,
+        parse_2=getattr(module_2, parse_name),
+        part_2=module_2.part_2,
+        version=version.hexdigest(),
+        dump_parsed=getattr(module_1, "dump_parsed", None),
+        load_parsed=getattr(module_1, "load_parsed", None),
+    )
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parse a day selection such as "1-16" or "1,3,5-7"."""
+    days: list[int] = []
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        if last:
+            days.extend(range(int(first), int(last) + 1))
+        else:
+            days.append(int(first))
+    return days
@@ -13,9 +13,23 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, Iterator
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.reader import read_lines
+
+
+def parse_data(filename: str | Path) -> list[str]:
+    return [line.decode() for line in read_lines(filename)]
 
-with open("input.txt") as f:
-    lines = f.readlines()
 
 ##########
 # Part 1 #
@@ -30,14 +44,16 @@ def get_digit(line: str) -> int:
     raise ValueError(f"expected digit in line {line}")
 
 
-digits = []
-for line in lines:
-    first_digit = get_digit(line)
-    last_digit = get_digit(reversed(line))
+def part_1(lines: list[str]) -> int:
+    digits = []
+    for line in lines:
+        first_digit = get_digit(line)
+        last_digit = get_digit(reversed(line))
 
-    digits.append(first_digit * 10 + last_digit)
+        digits.append(first_digit * 10 + last_digit)
+
+    return sum(digits)
 
-assert sum(digits) == 53334
 
 ##########
 # Part 2 #
@@ -46,36 +62,132 @@ assert sum(digits) == 53334
 DIGITS_ALPHA = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
 
 
-def get_digits(line):
-    numbers = {}
+DIGITS = {a: n + 1 for n, a in enumerate(DIGITS_ALPHA)} | {
+    str(n): n for n in range(1, 10)
+}
+
+# Automaton = (transitions, outputs): a transition table per state and the
+# digit recognised on entering the state, 0 for none.
+Automaton = tuple[list[dict[str, int]], list[int]]
+
+
+def build_automaton(patterns: dict[str, int]) -> Automaton:
+    """Aho-Corasick automaton with the failure links folded into the
+    transitions, so a scan does a single dict lookup per character."""
+    goto: list[dict[str, int]] = [{}]
+    outputs = [0]
+    for pattern, value in patterns.items():
+        state = 0
+        for c in pattern:
+            if c not in goto[state]:
+                goto.append({})
+                outputs.append(0)
+                goto[state][c] = len(goto) - 1
+            state = goto[state][c]
+        outputs[state] = value
+
+    alphabet = {c for pattern in patterns for c in pattern}
+    transitions: list[dict[str, int]] = [{} for _ in goto]
+    fail = [0] * len(goto)
+    queue = [0]  # breadth first, so failure states are always complete
+    for state in queue:
+        for c in alphabet:
+            if c in goto[state]:
+                child = goto[state][c]
+                transitions[state][c] = child
+                if state:
+                    fail[child] = transitions[fail[state]][c]
+                    outputs[child] = outputs[child] or outputs[fail[child]]
+                queue.append(child)
+            else:
+                transitions[state][c] = transitions[fail[state]][c] if state else 0
+
+    return transitions, outputs
+
+
+FORWARD = build_automaton(DIGITS)
+BACKWARD = build_automaton({pattern[::-1]: value for pattern, value in DIGITS.items()})
+
+
+def scan(automaton: Automaton, chars: Iterable[str]) -> int:
+    transitions, outputs = automaton
+    state = 0
+    for c in chars:
+        state = transitions[state].get(c, 0)
+        if outputs[state]:
+            # no digit word contains another, so the first match to end
+            # is also the first to start
+            return outputs[state]
+
+    raise ValueError("expected digit")
+
+
+def get_digits(line: str) -> tuple[int, int]:
+    return scan(FORWARD, line), scan(BACKWARD, reversed(line))
+
+
+def part_2(lines: list[str]) -> int:
+    numbers = []
+    for line in lines:
+        first_digit, last_digit = get_digits(line)
+
+        numbers.append(first_digit * 10 + last_digit)
+
+    return sum(numbers)
+
+
+###########
+# Chunked #
+###########
+
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def find_chunks(filename: str | Path, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yield (offset, length) spans of about chunk_size bytes, each ending
+    at a line boundary."""
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()  # finish the line the chunk ends in
+            end = f.tell()
+            yield start, end - start
+            start = end
+
+
+def solve_chunk(filename: str | Path, chunk: tuple[int, int]) -> tuple[int, int]:
+    offset, length = chunk
+    with open(filename, "rb") as f:
+        f.seek(offset)
+        lines = [line.strip().decode() for line in f.read(length).splitlines()]
 
-    for n in range(1, 10):
-        idx = line.find(str(n))
-        if idx != -1:
-            numbers[idx] = n
+    return part_1(lines), part_2(lines)
 
-        idx = line.rfind(str(n))
-        if idx != -1:
-            numbers[idx] = n
 
-    for n, a in enumerate(DIGITS_ALPHA):
-        idx = line.find(a)
-        if idx != -1:
-            numbers[idx] = n + 1
+def solve_chunked(
+    filename: str | Path, chunk_size: int = CHUNK_SIZE, workers: int | None = None
+) -> tuple[int, int]:
+    """Both parts, with the lines split into chunks solved in parallel.
 
-        idx = line.rfind(a)
-        if idx != -1:
-            numbers[idx] = n + 1
+    Workers read only their own chunk, so memory use depends on the chunk
+    size and not on the size of the file."""
+    chunks = find_chunks(filename, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(solve_chunk, repeat(filename), chunks))
 
-    a = sorted(numbers.items())
+    return sum(r[0] for r in results), sum(r[1] for r in results)
 
-    return a[0][1], a[-1][1]
 
+def main() -> None:
+    filename = Path(__file__).with_name("input.txt")
+    lines = parse_data(filename)
 
-numbers = []
-for line in lines:
-    first_digit, last_digit = get_digits(line)
+    assert part_1(lines) == 53334
+    assert part_2(lines) == 52834
+    assert solve_chunked(filename, chunk_size=4096) == (53334, 52834)
 
-    numbers.append(first_digit * 10 + last_digit)
 
-assert sum(numbers) == 52834
+if __name__ == "__main__":
+    main()
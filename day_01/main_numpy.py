@@ -0,0 +1,53 @@
+"""Advent of Code 2023 - Day 1, part 1 vectorized with NumPy
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pathlib import Path
+
+import numpy as np
+
+NEWLINE = ord("\n")
+
+
+def part_1(filename: str | Path) -> int:
+    """Part 1 straight from the raw bytes, without splitting lines."""
+    buffer = np.fromfile(filename, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == NEWLINE)
+
+    digits = np.flatnonzero((buffer >= ord("0")) & (buffer <= ord("9")))
+    values = buffer[digits].astype(np.int64) - ord("0")
+    # index of the newline ending each digit's line doubles as a line id
+    line_ids = np.searchsorted(newlines, digits)
+
+    line_changes = np.flatnonzero(line_ids[1:] != line_ids[:-1])
+    lines_with_digits = line_changes.size + 1 if digits.size else 0
+    tail = newlines[-1] + 1 if newlines.size else 0
+    lines = newlines.size + bool(np.any(buffer[tail:] > ord(" ")))
+    if lines_with_digits != lines:
+        raise ValueError(f"expected a digit on each of {lines} lines")
+    if not lines:
+        return 0
+
+    first = values[np.concatenate(([0], line_changes + 1))]
+    last = values[np.concatenate((line_changes, [len(values) - 1]))]
+
+    return int((first * 10 + last).sum())
+
+
+def main() -> None:
+    assert part_1(Path(__file__).with_name("input.txt")) == 53334
+
+
+if __name__ == "__main__":
+    main()
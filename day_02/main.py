@@ -13,75 +13,113 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from dataclasses import dataclass
+import re
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.reader import read_lines
+
+Bag = tuple[int, int, int]
+
+BAG: Bag = (12, 13, 14)
 
 
 @dataclass
-class Reveale:
-    game_round: int
-    r: int = 0
-    g: int = 0
-    b: int = 0
-
-
-def parse_games(filename: str) -> list[list[Reveale]]:
-    with open(filename) as f:
-        lines = f.readlines()
-    games: list[list[Reveale]] = []
-    for n, line in enumerate(lines, 1):
-        line = line.strip()
-
-        assert line.startswith(f"Game {n}: ")
-        _, line = line.split(":")
-
-        game = []
-        reveals = line.split("; ")
-
-        for rev in reveals:
-            color_reveal = Reveale(n)
-            for r in rev.split(", "):
-                if r.endswith(" red"):
-                    color_reveal.r = int(r[:-4])
-                elif r.endswith(" green"):
-                    color_reveal.g = int(r[:-6])
-                elif r.endswith(" blue"):
-                    color_reveal.b = int(r[:-5])
-                else:
-                    raise RuntimeError(f'error show not be possible: "{r}"')
-
-            game.append(color_reveal)
-        games.append(game)
+class Games:
+    """Columns with the fewest cubes of each colour every game needs."""
+
+    ids: array = field(default_factory=lambda: array("q"))
+    r: array = field(default_factory=lambda: array("q"))
+    g: array = field(default_factory=lambda: array("q"))
+    b: array = field(default_factory=lambda: array("q"))
+
+
+CUBE = rb"(\d+) (red|green|blue)"
+CUBES = re.compile(CUBE)
+# reveals separated by "; ", the cubes in a reveal by ", "
+REVEALS = re.compile(rb"%s(?:[,;] %s)*" % (CUBE, CUBE))
+
+
+def iter_games(filename: str | Path) -> Iterator[tuple[int, int, int, int]]:
+    """Yield the id and the fewest red, green and blue cubes of each game
+    while reading, so memory does not grow with the number of games."""
+    for n, line in enumerate(read_lines(filename), 1):
+        prefix = f"Game {n}: ".encode()
+        assert line.startswith(prefix)
+        reveals = line[len(prefix) :]
+        if not REVEALS.fullmatch(reveals):
+            for r in re.split(rb"[,;] ", reveals):
+                if not CUBES.fullmatch(r):
+                    raise RuntimeError(f'error show not be possible: "{r.decode()}"')
+
+        fewest = {b"red": 0, b"green": 0, b"blue": 0}
+        for count, colour in CUBES.findall(reveals):
+            if int(count) > fewest[colour]:
+                fewest[colour] = int(count)
+        yield n, fewest[b"red"], fewest[b"green"], fewest[b"blue"]
+
+
+def parse_games(filename: str | Path) -> Games:
+    games = Games()
+    for n, r, g, b in iter_games(filename):
+        games.ids.append(n)
+        games.r.append(r)
+        games.g.append(g)
+        games.b.append(b)
     return games
 
 
-def include_game(game) -> bool:
-    """Part 1"""
-    for r in game:
-        if r.r > 12 or r.g > 13 or r.b > 14:
-            return False
-    return True
+def dump_parsed(games: Games) -> bytes:
+    return b"".join(c.tobytes() for c in (games.ids, games.r, games.g, games.b))
+
+
+def load_parsed(blob: bytes) -> Games:
+    games = Games()
+    columns = (games.ids, games.r, games.g, games.b)
+    size = len(blob) // len(columns)
+    for i, column in enumerate(columns):
+        column.frombytes(blob[i * size : (i + 1) * size])
+    return games
 
 
-def get_fewest_power(game: list[Reveale]) -> int:
+def possible_games(games: Games, bag: Bag) -> int:
+    """Part 1, sum of the ids of the games possible with the bag"""
+    red, green, blue = bag
+    return sum(
+        n
+        for n, r, g, b in zip(games.ids, games.r, games.g, games.b)
+        if r <= red and g <= green and b <= blue
+    )
+
+
+def fewest_power(games: Games) -> int:
     """Part 2"""
-    min_r = 0
-    min_g = 0
-    min_b = 0
-    for r in game:
-        min_r = max(min_r, r.r)
-        min_g = max(min_g, r.g)
-        min_b = max(min_b, r.b)
-    return min_r * min_g * min_b
+    return sum(r * g * b for r, g, b in zip(games.r, games.g, games.b))
+
+
+def part_1(games: Games) -> int:
+    return possible_games(games, BAG)
+
+
+def part_2(games: Games) -> int:
+    return fewest_power(games)
 
 
 def main() -> None:
-    games = parse_games("input.txt")
+    games = parse_games(Path(__file__).with_name("input.txt"))
 
     ##########
     # Part 1 #
     ##########
 
-    result = sum(n for n, game in enumerate(games, 1) if include_game(game))
+    result = part_1(games)
 
     assert result == 2239
 
@@ -89,7 +127,7 @@ def main() -> None:
     # Part 2 #
     ##########
 
-    result = sum(get_fewest_power(g) for g in games)
+    result = part_2(games)
 
     assert result == 83435
 
@@ -0,0 +1,58 @@
+"""Advent of Code 2023 - Day 2, bag queries vectorized with NumPy
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from day_02.main import Bag, Games, parse_games
+
+BLOCK = 1 << 24  # booleans compared at once, bags times games
+
+
+def query_bags(games: Games, bags: Sequence[Bag]) -> tuple[np.ndarray, int]:
+    """Sum of the ids of the games possible with each bag, and the sum of the
+    powers, which does not depend on the bag."""
+    ids, r, g, b = (
+        np.frombuffer(c, dtype=np.int64) for c in (games.ids, games.r, games.g, games.b)
+    )
+    limits = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+
+    sums = np.empty(len(limits), dtype=np.int64)
+    step = max(1, BLOCK // max(1, len(ids)))
+    for start in range(0, len(limits), step):
+        red, green, blue = (c[:, None] for c in limits[start : start + step].T)
+        possible = (r <= red) & (g <= green) & (b <= blue)
+        sums[start : start + step] = possible @ ids
+
+    return sums, int((r * g * b).sum())
+
+
+def main() -> None:
+    games = parse_games(Path(__file__).with_name("input.txt"))
+
+    sums, power = query_bags(games, [(12, 13, 14)])
+    assert sums.tolist() == [2239]
+    assert power == 83435
+
+
+if __name__ == "__main__":
+    main()
@@ -13,121 +13,250 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
+from aoc.reader import read_lines
+
+
+NUMBERS = re.compile(rb"\d+")
+SYMBOLS = re.compile(rb"[^\d.]")
+
+# cell of every digit to the index of its number in the part numbers
+NumberIndex = dict[tuple[int, int], int]
+
+
+def column() -> array:
+    return array("q")
 
 
 @dataclass
-class SchemaNumber:
-    number: int
-    coordinates: list[Point] = field(default_factory=list)
+class Schema:
+    """Symbols and part numbers as flat columns, numbers by where they start
+    and how many digits they have."""
+
+    symbols: str = ""
+    symbol_xs: array = field(default_factory=column)
+    symbol_ys: array = field(default_factory=column)
+    numbers: array = field(default_factory=column)
+    number_xs: array = field(default_factory=column)
+    number_ys: array = field(default_factory=column)
+    number_lengths: array = field(default_factory=column)
+    index: NumberIndex = field(default_factory=dict)
+
+    def columns(self) -> tuple[array, ...]:
+        return (
+            self.symbol_xs,
+            self.symbol_ys,
+            self.numbers,
+            self.number_xs,
+            self.number_ys,
+            self.number_lengths,
+        )
+
+
+def parse_schema(filename: str | Path) -> Schema:
+    schema = Schema()
+    symbols = []
+    for y, line in enumerate(read_lines(filename)):
+        for m in NUMBERS.finditer(line):
+            schema.numbers.append(int(m[0]))
+            schema.number_xs.append(m.start())
+            schema.number_ys.append(y)
+            schema.number_lengths.append(m.end() - m.start())
+
+        for m in SYMBOLS.finditer(line):
+            symbols.append(m[0].decode())
+            schema.symbol_xs.append(m.start())
+            schema.symbol_ys.append(y)
+
+    schema.symbols = "".join(symbols)
+    schema.index = build_index(schema)
+    return schema
+
+
+def build_index(schema: Schema) -> NumberIndex:
+    return {
+        (x + i, y): n
+        for n, (x, y, length) in enumerate(
+            zip(schema.number_xs, schema.number_ys, schema.number_lengths)
+        )
+        for i in range(length)
+    }
+
+
+def dump_parsed(schema: Schema) -> bytes:
+    """Symbol and number counts, then the symbol values and the columns"""
+    return (
+        struct.pack("<QQ", len(schema.symbols), len(schema.numbers))
+        + schema.symbols.encode()
+        + b"".join(c.tobytes() for c in schema.columns())
+    )
+
+
+def load_parsed(blob: bytes) -> Schema:
+    symbol_count, number_count = struct.unpack_from("<QQ", blob)
+    offset = struct.calcsize("<QQ")
+
+    schema = Schema(symbols=blob[offset : offset + symbol_count].decode())
+    offset += symbol_count
+
+    for i, c in enumerate(schema.columns()):
+        size = (symbol_count if i < 2 else number_count) * c.itemsize
+        c.frombytes(blob[offset : offset + size])
+        offset += size
+
+    schema.index = build_index(schema)
+    return schema
+
+
+def get_adjacent_numbers(index: NumberIndex, x: int, y: int) -> set[int]:
+    """Indexes of the part numbers touching the cell"""
+    return {
+        index[p]
+        for p in (
+            (x - 1, y - 1),
+            (x, y - 1),
+            (x + 1, y - 1),
+            (x - 1, y),
+            (x + 1, y),
+            (x - 1, y + 1),
+            (x, y + 1),
+            (x + 1, y + 1),
+        )
+        if p in index
+    }
+
+
+def part_1(schema: Schema) -> int:
+    result: set[int] = set()
+    for x, y in zip(schema.symbol_xs, schema.symbol_ys):
+        result |= get_adjacent_numbers(schema.index, x, y)
+
+    return sum(schema.numbers[i] for i in result)
+
+
+def part_2(schema: Schema) -> int:
+    res = 0
+    for value, x, y in zip(schema.symbols, schema.symbol_xs, schema.symbol_ys):
+        if value == "*":
+            adjacent_numbers = get_adjacent_numbers(schema.index, x, y)
+            if len(adjacent_numbers) == 2:
+                first, second = adjacent_numbers
+                res += schema.numbers[first] * schema.numbers[second]
+
+    return res
+
+
+#############
+# Streaming #
+#############
+
+GEARS = re.compile(rb"\*")
+# digits and dots become ".", anything else is a symbol and becomes "#"
+SYMBOL_MARKS = bytes(
+    ord(".") if chr(c) in "0123456789." else ord("#") for c in range(256)
+)
 
 
 @dataclass
-class SchemaSymbol:
-    value: str
-    coordinates: Point
-
-
-def parse_schema(filename: str) -> tuple[list[SchemaSymbol], list[SchemaNumber]]:
-    with open(filename) as f:
-        lines = f.readlines()
-
-    lines = [line.strip() for line in lines]
-    # Parse schema
-    symbols: list[SchemaSymbol] = []
-    part_numbers: list[SchemaNumber] = []
-    for y, row in enumerate(lines):
-        current_part_number: SchemaNumber | None = None
-        for x, c in enumerate(row):
-            if c.isdigit():
-                if current_part_number:
-                    current_part_number.number = current_part_number.number * 10 + int(
-                        c
-                    )
-                else:
-                    current_part_number = SchemaNumber(int(c))
-
-                current_part_number.coordinates.append(Point(x, y))
-            else:
-                if current_part_number:
-                    part_numbers.append(current_part_number)
-                    current_part_number = None
-                if c == ".":
-                    continue  # not a symbol apparently
-
-                # symbol
-                symbols.append(SchemaSymbol(value=c, coordinates=Point(x, y)))
-
-        if current_part_number:
-            part_numbers.append(current_part_number)
-            current_part_number = None
-
-    return symbols, part_numbers
-
-
-def has_common_point(points_lhs, points_rhs) -> bool:
-    for l in points_lhs:
-        if l in points_rhs:
-            return True
-    return False
-
-
-def get_adjacent_numbers(
-    part_numbers: list[SchemaNumber], p: Point
-) -> list[SchemaNumber]:
-    adjacent_points = [
-        Point(p.x - 1, p.y - 1),
-        Point(p.x, p.y - 1),
-        Point(p.x + 1, p.y - 1),
-        Point(p.x - 1, p.y),
-        # Point(p.x, p.y),
-        Point(p.x + 1, p.y),
-        Point(p.x - 1, p.y + 1),
-        Point(p.x, p.y + 1),
-        Point(p.x + 1, p.y + 1),
-    ]
-
-    numbers = []
-    for part in part_numbers:
-        if has_common_point(part.coordinates, adjacent_points):
-            numbers.append(part)
-
-    return numbers
+class Row:
+    numbers: list[tuple[int, int, int]]  # start, end and value, left to right
+    starts: list[int]
+    symbols: bytes
+    gears: list[int]
+
+
+EMPTY_ROW = Row([], [], b"", [])
+
+
+def scan_row(line: bytes) -> Row:
+    numbers = [(m.start(), m.end(), int(m[0])) for m in NUMBERS.finditer(line)]
+    return Row(
+        numbers=numbers,
+        starts=[start for start, _, _ in numbers],
+        symbols=line.translate(SYMBOL_MARKS),
+        gears=[m.start() for m in GEARS.finditer(line)],
+    )
+
+
+def numbers_around(row: Row, x: int) -> Iterator[int]:
+    """Values of the numbers in the row touching column x"""
+    # numbers do not overlap, so only the last two starting by x + 1 can reach x
+    i = bisect_right(row.starts, x + 1)
+    for start, end, value in row.numbers[max(0, i - 2) : i]:
+        if end >= x:
+            yield value
+
+
+def row_sums(above: Row, row: Row, below: Row) -> tuple[int, int]:
+    """Part numbers and gear ratios of the middle row"""
+    window = (above, row, below)
+
+    parts = 0
+    for start, end, value in row.numbers:
+        lo = max(0, start - 1)
+        if any(b"#" in r.symbols[lo : end + 1] for r in window):
+            parts += value
+
+    ratios = 0
+    for x in row.gears:
+        adjacent = [value for r in window for value in numbers_around(r, x)]
+        if len(adjacent) == 2:
+            ratios += adjacent[0] * adjacent[1]
+
+    return parts, ratios
+
+
+def iter_row_sums(filename: str | Path) -> Iterator[tuple[int, int]]:
+    """Yield part number and gear ratio sums row by row, holding only three
+    rows at a time."""
+    above, row = EMPTY_ROW, None
+    for line in read_lines(filename):
+        below = scan_row(line)
+        if row is not None:
+            yield row_sums(above, row, below)
+            above = row
+        row = below
+
+    if row is not None:
+        yield row_sums(above, row, EMPTY_ROW)
+
+
+def solve_streaming(filename: str | Path) -> tuple[int, int]:
+    parts = ratios = 0
+    for row_parts, row_ratios in iter_row_sums(filename):
+        parts += row_parts
+        ratios += row_ratios
+    return parts, ratios
 
 
 def main() -> None:
-    symbols, part_numbers = parse_schema("input.txt")
+    schema = parse_schema(Path(__file__).with_name("input.txt"))
 
     ##########
     # Part 1 #
     ##########
 
-    result: list[SchemaNumber] = []
-    for sym in symbols:
-        for adjacent_number in get_adjacent_numbers(part_numbers, sym.coordinates):
-            if adjacent_number not in result:
-                result.append(adjacent_number)
-
-    assert sum(r.number for r in result) == 556367
+    assert part_1(schema) == 556367
 
     ##########
     # Part 2 #
     ##########
 
-    res = 0
-    for sym in symbols:
-        if sym.value == "*":
-            adjacent_numbers = get_adjacent_numbers(part_numbers, sym.coordinates)
-            if len(adjacent_numbers) == 2:
-                res += adjacent_numbers[0].number * adjacent_numbers[1].number
+    assert part_2(schema) == 89471771
 
-    assert res == 89471771
+    assert solve_streaming(Path(__file__).with_name("input.txt")) == (556367, 89471771)
 
 
 if __name__ == "__main__":
@@ -13,72 +13,118 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_numbers(filename: str) -> list[tuple[list, list]]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
-    cards = []
-    for n, line in enumerate(lines, 1):
-        assert line.startswith(f"Card {n:>3}: ")
-        line = line[len(f"Card {n:>3}: ") :]
+def card_mask(numbers: bytes) -> int:
+    """Numbers of a card as set bits"""
+    mask = 0
+    for number in numbers.split():
+        mask |= 1 << int(number)
+    return mask
 
-        winning_numbers_str, my_numbers_str = line.split("|")
 
-        winning_numbers_strs = winning_numbers_str.strip().split(" ")
-        my_numbers_strs = my_numbers_str.strip().split(" ")
+def iter_matches(filename: str | Path) -> Iterator[int]:
+    """How many of my numbers are winning numbers, card by card"""
+    for n, line in enumerate(read_lines(filename), 1):
+        prefix = f"Card {n:>3}: ".encode()
+        assert line.startswith(prefix)
+        line = line[len(prefix) :]
 
-        # Remove blank spaces from splitting and parse as ints
-        winning_numbers = [int(w) for w in winning_numbers_strs if w]
-        my_numbers = [int(m) for m in my_numbers_strs if m]
+        winning_numbers, my_numbers = line.split(b"|")
+        yield (card_mask(winning_numbers) & card_mask(my_numbers)).bit_count()
 
-        cards.append((winning_numbers, my_numbers))
 
-    return cards
+def parse_numbers(filename: str | Path) -> list[int]:
+    return list(iter_matches(filename))
+
+
+def part_1(matches: list[int]) -> int:
+    return sum(1 << (m - 1) for m in matches if m)
+
+
+def part_2(matches: list[int]) -> int:
+    # copies won by a card are added to a range of the following cards, kept
+    # as the change in copies at the start and past the end of the range
+    copies_change = [0] * (len(matches) + 1)
+    copies = 0
+    total = 0
+    for n, m in enumerate(matches):
+        copies += copies_change[n]
+        card_count = 1 + copies
+        total += card_count
+
+        copies_change[n + 1] += card_count
+        copies_change[min(n + 1 + m, len(matches))] -= card_count
+
+    return total
+
+
+#############
+# Streaming #
+#############
+
+# numbers are below 100, so a card wins copies of at most the next 100 cards
+RING_SIZE = 128
+
+
+def iter_totals(matches: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """Yield the running totals of both parts after each card.
+
+    The changes in copies of the cards still to come are kept in a ring
+    buffer, so memory stays constant however many cards there are."""
+    copies_change = [0] * RING_SIZE
+    copies = 0
+    points = 0
+    total = 0
+    for n, m in enumerate(matches):
+        if m + 2 > RING_SIZE:
+            raise ValueError(f"card {n + 1} wins more cards than the ring holds")
+
+        slot = n % RING_SIZE
+        copies += copies_change[slot]
+        copies_change[slot] = 0
+        card_count = 1 + copies
+
+        copies_change[(n + 1) % RING_SIZE] += card_count
+        copies_change[(n + 1 + m) % RING_SIZE] -= card_count
+
+        points += 1 << (m - 1) if m else 0
+        total += card_count
+        yield points, total
+
+
+def solve_streaming(filename: str | Path) -> tuple[int, int]:
+    totals = (0, 0)
+    for totals in iter_totals(iter_matches(filename)):
+        pass
+    return totals
 
 
 def main() -> None:
-    cards = parse_numbers("input.txt")
+    cards = parse_numbers(Path(__file__).with_name("input.txt"))
 
     ##########
     # Part 1 #
     ##########
 
-    total = 0
-    for card in cards:
-        round_points = 0
-        for win in card[0]:
-            if win in card[1]:
-                if round_points == 0:
-                    round_points = 1
-                else:
-                    round_points *= 2
-        total += round_points
-
-    assert total == 19135
+    assert part_1(cards) == 19135
 
     ##########
     # Part 2 #
     ##########
 
-    card_count = [1 for _ in cards]
-    for game_num, card in enumerate(cards):
-        round_multiplier = card_count[game_num]
-        round_wins = 0
-        for win in card[0]:
-            if win in card[1]:
-                round_wins += 1
-
-        # increase card counts
-        for i in range(game_num + 1, game_num + round_wins + 1):
-            if i > len(card_count):
-                break
-            card_count[i] += 1 * round_multiplier
-
-    assert sum(card_count) == 5704953
+    assert part_2(cards) == 5704953
+
+    assert solve_streaming(Path(__file__).with_name("input.txt")) == (19135, 5704953)
 
 
 if __name__ == "__main__":
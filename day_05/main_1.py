@@ -13,25 +13,35 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str) -> tuple[list[int], list[list[tuple[int, int, int]]]]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
-    assert lines[0].startswith("seeds: ")
-    seeds_strs = lines[0][len("seeds: ") :].split()
+def parse_data(filename: str | Path) -> tuple[list[int], list[list[tuple[int, int, int]]]]:
+    lines = read_lines(filename)
+
+    first_line = next(lines)
+    assert first_line.startswith(b"seeds: ")
+    seeds_strs = first_line[len(b"seeds: ") :].split()
     seeds = list(int(s) for s in seeds_strs)
 
     seed_to_stuff = []
     current_map = None
-    for line in lines[1:]:
+    for line in lines:
         if not line:
             continue
 
-        if not line[0].isdigit():
+        if not line[:1].isdigit():
             if current_map:
                 seed_to_stuff.append(current_map)
             current_map = []
@@ -50,13 +60,102 @@ def resolve_location(seed: int, ranges: list[tuple[int, int, int]]):
     return seed
 
 
+@dataclass
+class PiecewiseMap:
+    """Maps x to x + offsets[i] for starts[i] <= x < starts[i + 1], the last
+    piece running to infinity. starts[0] is 0, inputs are never negative."""
+
+    starts: array = field(default_factory=lambda: array("q", [0]))
+    offsets: array = field(default_factory=lambda: array("q", [0]))
+
+    @classmethod
+    def from_ranges(cls, ranges: list[tuple[int, int, int]]) -> "PiecewiseMap":
+        """One almanac stage, values outside every range map to themselves"""
+        result = cls(array("q"), array("q"))
+        position = 0
+        for dest, source, length in sorted(ranges, key=lambda r: r[1]):
+            if position < source:
+                result.add_piece(position, 0)
+            result.add_piece(source, dest - source)
+            position = source + length
+        result.add_piece(position, 0)
+        return result
+
+    def add_piece(self, start: int, offset: int) -> None:
+        """Start a piece after the last one, merged into it on equal offsets"""
+        if self.starts and self.starts[-1] == start:
+            self.starts.pop()
+            self.offsets.pop()
+        if not self.offsets or self.offsets[-1] != offset:
+            self.starts.append(start)
+            self.offsets.append(offset)
+
+    def pieces(self) -> Iterator[tuple[int, int | None, int]]:
+        """Start, stop and offset of each piece, stop is None for the last"""
+        stops = list(self.starts[1:]) + [None]
+        return zip(self.starts, stops, self.offsets)
+
+    def then(self, after: "PiecewiseMap") -> "PiecewiseMap":
+        """The map applying this one and then after"""
+        result = PiecewiseMap(array("q"), array("q"))
+        for start, stop, offset in self.pieces():
+            # split the image of the piece where a piece of after starts
+            j = bisect_right(after.starts, start + offset) - 1
+            result.add_piece(start, offset + after.offsets[j])
+            for j in range(j + 1, len(after.starts)):
+                split = after.starts[j] - offset
+                if stop is not None and split >= stop:
+                    break
+                result.add_piece(split, offset + after.offsets[j])
+        return result
+
+    def __call__(self, x: int) -> int:
+        return x + self.offsets[bisect_right(self.starts, x) - 1]
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"[{start}, {'inf' if stop is None else stop}) {offset:+}"
+            for start, stop, offset in self.pieces()
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.starts.tobytes() + self.offsets.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PiecewiseMap":
+        result = cls(array("q"), array("q"))
+        result.starts.frombytes(data[: len(data) // 2])
+        result.offsets.frombytes(data[len(data) // 2 :])
+        return result
+
+
+def compose(functions: list[list[tuple[int, int, int]]]) -> PiecewiseMap:
+    """All stages of the almanac as one map from seed to location"""
+    result = PiecewiseMap()
+    for function in functions:
+        result = result.then(PiecewiseMap.from_ranges(function))
+    return result
+
+
+def part_1(almanac: tuple[list[int], list[list[tuple[int, int, int]]]]) -> int:
+    seeds, functions = almanac
+
+    seed_to_location = compose(functions)
+    return min(seed_to_location(seed) for seed in seeds)
+
+
 def main() -> None:
-    data, functions = parse_data("input.txt")
+    almanac = parse_data(Path(__file__).with_name("input.txt"))
 
-    for function in functions:
-        data = [resolve_location(seed, function) for seed in data]
+    assert part_1(almanac) == 57075758
 
-    assert min(data) == 57075758
+    seeds, functions = almanac
+    seed_to_location = compose(functions)
+    for seed in seeds:
+        location = seed
+        for function in functions:
+            location = resolve_location(location, function)
+        assert seed_to_location(seed) == location
 
 
 if __name__ == "__main__":
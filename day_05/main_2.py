@@ -13,48 +13,16 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def range_intersection(r1: range, r2: range) -> range | None:
-    start = max(r1.start, r2.start)
-    stop = min(r1.stop, r2.stop)
-
-    if start >= stop:
-        return None
-
-    return range(start, stop)
-
-
-def range_left_disjoint(r1: range, r2: range) -> list[range]:
-    intersection = range_intersection(r1, r2)
-    if not intersection:
-        return [r1]  # disjoint ranges
-
-    result = []
-
-    left_start = r1.start
-    left_stop = r2.start
-    if left_start < left_stop:
-        result.append(range(left_start, left_stop))
-
-    right_start = r2.stop
-    right_stop = r1.stop
-    if right_start < right_stop:
-        result.append(range(right_start, right_stop))
-
-    return result
-
-
-# sanity check
-assert range_intersection(range(10, 18), range(1, 14)) == range(10, 14)
-assert range_left_disjoint(range(10, 18), range(1, 14)) == [range(14, 18)]
-assert range_left_disjoint(range(1, 14), range(10, 18)) == [range(1, 10)]
-assert range_left_disjoint(range(1, 20), range(10, 18)) == [range(1, 10), range(18, 20)]
-
-
-def range_offset(r: range, offset: int) -> range:
-    return range(r.start + offset, r.stop + offset)
+from aoc.intervals import IntervalSet
+from aoc.reader import read_lines
 
 
 @dataclass
@@ -66,35 +34,22 @@ class RangeFunction:
         self.in_range = range(source, source + length)
         self.offset = dest - source
 
-    def transform_range(self, input_range: range, rest: list[range]) -> range | None:
-        intersection = range_intersection(self.in_range, input_range)
-
-        for r in range_left_disjoint(input_range, self.in_range):
-            rest.append(r)
 
-        if not intersection:
-            return None
+def parse_data(filename: str | Path) -> tuple[list[int], list[list[RangeFunction]]]:
+    lines = read_lines(filename)
 
-        return range_offset(intersection, self.offset)
-
-
-def parse_data(filename: str) -> tuple[list[int], list[list[RangeFunction]]]:
-    with open(filename) as f:
-        lines = f.readlines()
-
-    lines = [line.strip() for line in lines]
-
-    assert lines[0].startswith("seeds: ")
-    seeds_strs = lines[0][len("seeds: ") :].split()
+    first_line = next(lines)
+    assert first_line.startswith(b"seeds: ")
+    seeds_strs = first_line[len(b"seeds: ") :].split()
     seeds = list(int(s) for s in seeds_strs)
 
     range_functions = []
     current_map = None
-    for line in lines[1:]:
+    for line in lines:
         if not line:
             continue
 
-        if not line[0].isdigit():
+        if not line[:1].isdigit():
             if current_map:
                 range_functions.append(current_map)
             current_map = []
@@ -106,26 +61,30 @@ def parse_data(filename: str) -> tuple[list[int], list[list[RangeFunction]]]:
     return seeds, range_functions
 
 
-def main() -> None:
-    seeds, range_functions = parse_data("input.txt")
+def apply_stage(seeds: IntervalSet, stage: list[RangeFunction]) -> IntervalSet:
+    """Image of the seeds through one stage"""
+    return seeds.map_pieces(
+        (f.in_range.start, f.in_range.stop, f.offset) for f in stage
+    )
+
 
-    input_data: list[range] = []
-    for n in range(0, len(seeds), 2):
-        input_data.append(range(seeds[n], seeds[n] + seeds[n + 1]))
+def part_2(almanac: tuple[list[int], list[list[RangeFunction]]]) -> int:
+    seeds, range_functions = almanac
+
+    input_data = IntervalSet(
+        (seeds[n], seeds[n] + seeds[n + 1]) for n in range(0, len(seeds), 2)
+    )
 
     for stage in range_functions:
-        results: list[range] = []
-        for func in stage:
-            other: list[range] = []
-            for r in input_data:
-                new_range = func.transform_range(r, other)
-                if new_range:
-                    results.append(new_range)
-            input_data = other
-
-        input_data = results + input_data
-
-    assert min(r.start for r in input_data) == 31161857
+        input_data = apply_stage(input_data, stage)
+
+    return input_data.starts[0]
+
+
+def main() -> None:
+    almanac = parse_data(Path(__file__).with_name("input.txt"))
+
+    assert part_2(almanac) == 31161857
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""Advent of Code 2023 - Day 5, batch seed lookups vectorized with NumPy
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from day_05.main_1 import PiecewiseMap, compose, parse_data
+
+
+def lookup(seed_to_location: PiecewiseMap, seeds: np.ndarray) -> np.ndarray:
+    """Locations of all the seeds, seeds must not be negative"""
+    starts = np.frombuffer(seed_to_location.starts, dtype=np.int64)
+    offsets = np.frombuffer(seed_to_location.offsets, dtype=np.int64)
+    pieces = np.searchsorted(starts, seeds, side="right") - 1
+    return seeds + offsets[pieces]
+
+
+def part_1(almanac: tuple[list[int], list[list[tuple[int, int, int]]]]) -> int:
+    seeds, functions = almanac
+    return int(lookup(compose(functions), np.array(seeds, dtype=np.int64)).min())
+
+
+def main() -> None:
+    almanac = parse_data(Path(__file__).with_name("input.txt"))
+
+    assert part_1(almanac) == 57075758
+
+
+if __name__ == "__main__":
+    main()
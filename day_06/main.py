@@ -13,48 +13,79 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import math
+import sys
+from pathlib import Path
+from typing import Iterable
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str):
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
-    assert lines[0].startswith('Time:      ')
-    times = [int(t) for t in lines[0][len('Time:      '):].split() if t]
-    assert lines[1].startswith('Distance:  ')
-    distance = [int(t) for t in lines[1][len('Distance:  '):].split() if t]
+def parse_data(filename: str | Path):
+    lines = list(read_lines(filename))
 
-    return times, distance
+    assert lines[0].startswith(b'Time:      ')
+    times = [int(t) for t in lines[0][len(b'Time:      '):].split() if t]
+    assert lines[1].startswith(b'Distance:  ')
+    distance = [int(t) for t in lines[1][len(b'Distance:  '):].split() if t]
 
+    return times, distance
 
 
 def ways_to_win(current_winning_time: int, winning_distance: int) -> int:
-    count = 0
-    for hold_time in range(1, current_winning_time):
-        distance = hold_time * (current_winning_time - hold_time)
-        if distance > winning_distance:
-            count += 1
-    return count
+    """Hold times h with h * (time - h) > distance, which lie strictly
+    between the roots of h^2 - time * h + distance, in exact integers."""
+    discriminant = current_winning_time**2 - 4 * winning_distance
+    if discriminant < 0:
+        return 0
+
+    # smallest winning hold time, isqrt can put this one below it
+    shortest = (current_winning_time - math.isqrt(discriminant)) // 2
+    if shortest * (current_winning_time - shortest) <= winning_distance:
+        shortest += 1
+
+    # the longest is as far from the time as the shortest is from 0
+    return max(0, current_winning_time - 2 * shortest + 1)
+
+
+def ways_to_win_many(times: Iterable[int], distances: Iterable[int]) -> list[int]:
+    return [ways_to_win(t, d) for t, d in zip(times, distances)]
+
+
+def part_1(data: tuple[list[int], list[int]]) -> int:
+    times, distance = data
+
+    return math.prod(ways_to_win_many(times, distance))
+
+
+def part_2(data: tuple[list[int], list[int]]) -> int:
+    times, distance = data
+
+    # the spaces between the numbers were bad kerning, it is a single race
+    time = int("".join(str(t) for t in times))
+    distance = int("".join(str(d) for d in distance))
+    return ways_to_win(time, distance)
+
+
+def main() -> None:
+    data = parse_data(Path(__file__).with_name("input.txt"))
 
-times, distance = parse_data("input.txt")
+    ##########
+    # Part 1 #
+    ##########
 
-##########
-# Part 1 #
-##########
+    assert part_1(data) == 32076
 
-s = 1
-for t, d in zip(times, distance):
-    s*=ways_to_win(t, d)
-print(s)
+    ##########
+    # Part 2 #
+    ##########
 
-##########
-# Part 2 #
-##########
+    assert part_2(data) == 34278221
 
-# the parsing was unnecessary since it took longer to write that then just putting the numbers here directly :)
 
-time = 44806572
-distance = 208158110501102
-print(ways_to_win(time, distance))
+if __name__ == "__main__":
+    main()
@@ -15,30 +15,35 @@
 """
 
 
+import sys
 from dataclasses import dataclass
 from collections import Counter
+from pathlib import Path
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.reader import read_lines
 
 RANKS = list(
     reversed(["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"])
 )
-
-
-print(len(RANKS))
+RANK_VALUES = {r: n for n, r in enumerate(RANKS)}
 
 
 @dataclass
 class Hand:
-    values: str
+    values: list[int]
+    key: int
 
     def __init__(self, chars):
-        self.values = []
-        for c in chars:
-            for n, r in enumerate(RANKS):
-                if c == r:
-                    self.values.append(n)
-                    break
+        self.values = [RANK_VALUES[c] for c in chars]
 
-        assert len(chars) == len(self.values)
+        # type above the card ranks, 4 bits per card, so hands sort as ints
+        self.key = self.get_type()
+        for value in self.values:
+            self.key = self.key << 4 | value
 
     def get_type(self):
         c = Counter(self.values)
@@ -70,49 +75,41 @@ class Hand:
 
         return 1  # High card
 
-    def __lt__(self, other: "Hand") -> bool:
-        left_type = self.get_type()
-        right_type = other.get_type()
-
-        if left_type < right_type:
-            return True
-
-        if left_type == right_type:
-            for lc, rc in zip(self.values, other.values):
-                if lc < rc:
-                    return True
-                if lc > rc:
-                    return False
+    def __int__(self) -> int:
+        return self.key
 
-        return False
+    def __lt__(self, other: "Hand") -> bool:
+        return self.key < other.key
 
     def __eq__(self, other: "Hand") -> bool:
         return self.values == other.values
 
 
-def parse_data(filename: str):
-    with open(filename) as f:
-        lines = f.readlines()
-
-    lines = [line.strip() for line in lines]
-
+def parse_data(filename: str | Path):
     res = []
-    for line in lines:
+    for line in read_lines(filename):
         chars, num = line.split()
         assert len(chars) == 5
-        res.append((Hand(chars), int(num)))
+        res.append((Hand(chars.decode()), int(num)))
 
     return res
 
 
-data = parse_data("input.txt")
+def part_1(data: list[tuple[Hand, int]]) -> int:
+    data = sorted(data, key=lambda item: int(item[0]))
+
+    result = 0
+    for rank, (hand, num) in enumerate(data, 1):
+        result += rank * num
+
+    return result
+
 
-data = sorted(data, key=lambda item: item[0])
+def main() -> None:
+    data = parse_data(Path(__file__).with_name("input.txt"))
 
+    assert part_1(data) == 253313241
 
-result = 0
-for rank, (hand, num) in enumerate(data, 1):
-    print(rank, hand.get_type(), hand, num)
-    result += rank * num
 
-assert result == 253313241
+if __name__ == "__main__":
+    main()
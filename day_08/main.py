@@ -13,21 +13,27 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from itertools import cycle
 from math import lcm
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str) -> tuple[str, dict[str, tuple[str, str]]]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
-    directions = lines[0]
+def parse_data(filename: str | Path) -> tuple[str, dict[str, tuple[str, str]]]:
+    lines = read_lines(filename)
+
+    directions = next(lines).decode()
+    assert not next(lines)
 
     step_map = {}
-    for line in lines[2:]:
-        start, choises = line.split("=")
+    for line in lines:
+        start, choises = line.decode().split("=")
         l, r = choises.strip().strip("(").strip(")").split(",")
 
         step_map[start.strip()] = (l, r.strip())
@@ -35,12 +41,11 @@ def parse_data(filename: str) -> tuple[str, dict[str, tuple[str, str]]]:
     return directions, step_map
 
 
-def main() -> None:
-    directions, step_map = parse_data("input.txt")
+Network = tuple[str, dict[str, tuple[str, str]]]
 
-    ##########
-    # Part 1 #
-    ##########
+
+def part_1(network: Network) -> int:
+    directions, step_map = network
 
     steps_taken = 0
     next_step = "AAA"
@@ -57,11 +62,11 @@ def main() -> None:
         if next_step == "ZZZ":
             break
 
-    assert steps_taken == 22199
+    return steps_taken
 
-    ##########
-    # Part 2 #
-    ##########
+
+def part_2(network: Network) -> int:
+    directions, step_map = network
 
     # Find start locations
     next_locations = []
@@ -91,7 +96,23 @@ def main() -> None:
         if all(end for end in end_hit_after):
             break
 
-    assert lcm(*end_hit_after) == 13334102464297
+    return lcm(*end_hit_after)
+
+
+def main() -> None:
+    network = parse_data(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
+
+    assert part_1(network) == 22199
+
+    ##########
+    # Part 2 #
+    ##########
+
+    assert part_2(network) == 13334102464297
 
 
 if __name__ == "__main__":
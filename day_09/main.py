@@ -13,16 +13,19 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str) -> list[list[int]]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
+def parse_data(filename: str | Path) -> list[list[int]]:
     numbers = []
-    for line in lines:
+    for line in read_lines(filename):
         numbers.append(list(int(n) for n in line.split()))
 
     return numbers
@@ -53,13 +56,21 @@ def find_previous_number(differences) -> int:
     return next_num
 
 
+def part_1(numbers: list[list[int]]) -> int:
+    return sum(find_next_number(seq) for seq in numbers)
+
+
+def part_2(numbers: list[list[int]]) -> int:
+    return sum(find_previous_number(seq) for seq in numbers)
+
+
 def main() -> None:
-    numbers = parse_data("input.txt")
+    numbers = parse_data(Path(__file__).with_name("input.txt"))
 
-    result = sum(find_next_number(seq) for seq in numbers)
+    result = part_1(numbers)
     assert result == 2101499000
 
-    result = sum(find_previous_number(seq) for seq in numbers)
+    result = part_2(numbers)
     assert result == 1089
 
 
@@ -13,115 +13,100 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from enum import Enum, auto
-from typing import Iterable
+from itertools import pairwise
+from pathlib import Path
+from typing import Iterable, Iterator
 
-Point = tuple[int, int]
-Grid = list[list[str | None]]  # note only one char for each element
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from aoc.grid import Grid, Point
+from aoc.reader import read_lines
 
-def parse_data(filename: str) -> Grid:
-    with open(filename) as f:
-        lines = f.readlines()
+EMPTY = " "  # cells of the clean copy that are not part of the tunnel
 
-    lines = [line.strip() for line in lines]
+# hot loops compare raw cell bytes
+EMPTY_CELL = ord(EMPTY)
+INSIDE_CELL = ord("I")
+START_CELL = ord("S")
 
-    grid: Grid = list(list(c for c in line) for line in lines)
+# shapes that connect to a neighbour, the start connects every way
+OPENS_EAST = frozenset(b"-FLS")
+OPENS_WEST = frozenset(b"-7JS")
+OPENS_NORTH = frozenset(b"|LJS")
+OPENS_SOUTH = frozenset(b"|F7S")
 
-    return grid
+# step to a neighbour and the shapes there that connect back
+WEST = (-1, 0, OPENS_EAST)
+EAST = (1, 0, OPENS_WEST)
+NORTH = (0, -1, OPENS_SOUTH)
+SOUTH = (0, 1, OPENS_NORTH)
 
+CONNECTIONS = {
+    ord("-"): (WEST, EAST),
+    ord("|"): (NORTH, SOUTH),
+    ord("F"): (EAST, SOUTH),
+    ord("7"): (WEST, SOUTH),
+    ord("J"): (NORTH, WEST),
+    ord("L"): (NORTH, EAST),
+}
 
-def get_start_point(data: Grid) -> Point:
-    for y, row in enumerate(data):
-        for x, v in enumerate(row):
-            if v == "S":
-                return (x, y)
 
-    raise ValueError("unable to find start")
+def parse_data(filename: str | Path) -> Grid:
+    return Grid.from_lines(read_lines(filename))
 
 
-def get_next_points(point: Point, data: Grid) -> list[Point]:
-    """Get the next possible coorinates to walk to.
-    The result should contain two points if the input data is sane."""
-    x, y = point
-    connecting_points = []
-    if data[y][x] == "-":
-        if data[y][x - 1] in ("-", "F", "L", "S"):
-            connecting_points.append((x - 1, y))
-        if data[y][x + 1] in ("-", "7", "J", "S"):
-            connecting_points.append((x + 1, y))
-    elif data[y][x] == "|":
-        if data[y - 1][x] in ("|", "F", "7", "S"):
-            connecting_points.append((x, y - 1))
-        if data[y + 1][x] in ("|", "L", "J", "S"):
-            connecting_points.append((x, y + 1))
-    elif data[y][x] == "F":
-        if data[y][x + 1] in ("-", "7", "J", "S"):
-            connecting_points.append((x + 1, y))
-        if data[y + 1][x] in ("|", "L", "J", "S"):
-            connecting_points.append((x, y + 1))
-    elif data[y][x] == "7":
-        if data[y][x - 1] in ("-", "F", "L", "S"):
-            connecting_points.append((x - 1, y))
-        if data[y + 1][x] in ("|", "L", "J", "S"):
-            connecting_points.append((x, y + 1))
-    elif data[y][x] == "J":
-        if data[y - 1][x] in ("|", "F", "7", "S"):
-            connecting_points.append((x, y - 1))
-        if data[y][x - 1] in ("-", "L", "F", "S"):
-            connecting_points.append((x - 1, y))
-    elif data[y][x] == "L":
-        if data[y - 1][x] in ("|", "F", "7", "S"):
-            connecting_points.append((x, y - 1))
-        if data[y][x + 1] in ("-", "7", "J", "S"):
-            connecting_points.append((x + 1, y))
-    else:
-        raise RuntimeError(f"not a recognized shape {data[y][x]}")
-
-    return connecting_points
+def dump_parsed(data: Grid) -> bytes:
+    return data.to_bytes()
+
+
+def load_parsed(blob: bytes) -> Grid:
+    return Grid.from_bytes(blob)
+
+
+def get_start_point(data: Grid) -> Point:
+    try:
+        return data.find("S")
+    except ValueError:
+        raise ValueError("unable to find start")
 
 
 def get_from_start(point: Point, data: Grid) -> list[Point]:
     """Special case for start since we do not know the directions from the value."""
     x, y = point
-    connecting_points = []
-    assert data[y][x] == "S"
-    if data[y][x - 1] in ("-", "F", "L"):
-        connecting_points.append((x - 1, y))
-    if data[y][x + 1] in ("-", "7", "J"):
-        connecting_points.append((x + 1, y))
-    if data[y - 1][x] in ("|", "F", "7"):
-        connecting_points.append((x, y - 1))
-    if data[y + 1][x] in ("|", "L", "J"):
-        connecting_points.append((x, y + 1))
-    return connecting_points
-
-
-def is_start(point: Point, data: Grid) -> bool:
-    x, y = point
-    return data[y][x] == "S"
+    cells, width = data.cells, data.width
+    assert cells[y * width + x] == START_CELL
+    return [
+        (x + dx, y + dy)
+        for dx, dy, connects in (WEST, EAST, NORTH, SOUTH)
+        if cells[(y + dy) * width + x + dx] in connects
+    ]
 
 
 # Part 2 functions, now it gets a bit ugly. There is probably an easier way to solve this.
 
 
 def create_clean_copy(data: Grid, tunnel_coordinates: Iterable[Point]) -> Grid:
-    """Create a copy with only the tunnel, everything else is set to None
+    """Create a copy with only the tunnel, everything else is set to EMPTY
     Also make it bigger so we dont have to handle edges and corners"""
-    clean_copy: Grid = [
-        [None for _ in range(len(data[0]) + 2)] for _ in range(len(data) + 2)
-    ]
-    for y, row in enumerate(data):
-        for x, value in enumerate(row):
-            if (x, y) in tunnel_coordinates:
-                clean_copy[y + 1][x + 1] = value
+    clean_copy = Grid.filled(data.width + 2, data.height + 2, EMPTY)
+    for x, y in tunnel_coordinates:
+        clean_copy.cells[(y + 1) * clean_copy.width + x + 1] = data.cells[
+            y * data.width + x
+        ]
     return clean_copy
 
 
 def find_connected_points_and_mark(data: Grid, point: Point) -> list[Point]:
     """Mark the supplied point as inside and also mark any adjacent points."""
     x, y = point
-    search_points = [
+    cells, width, height = data.cells, data.width, data.height
+
+    search_points = []
+    for px, py in (
         (x - 1, y - 1),
         (x, y - 1),
         (x + 1, y - 1),
@@ -131,19 +116,13 @@ def find_connected_points_and_mark(data: Grid, point: Point) -> list[Point]:
         (x - 1, y + 1),
         (x, y + 1),
         (x + 1, y + 1),
-    ]
-
-    # discard invalid points
-    search_points = [
-        (x, y)
-        for x, y in search_points
-        if x in range(0, len(data[0])) and y in range(0, len(data))
-    ]
-    # discard taken points
-    search_points = [(x, y) for x, y in search_points if data[y][x] is None]
-    # mark as taken
-    for x, y in search_points:
-        data[y][x] = "I"
+    ):
+        # discard invalid and taken points, mark the others as taken
+        if 0 <= px < width and 0 <= py < height:
+            index = py * width + px
+            if cells[index] == EMPTY_CELL:
+                cells[index] = INSIDE_CELL
+                search_points.append((px, py))
 
     return search_points
 
@@ -163,29 +142,13 @@ class Direction(Enum):
     SOUTH = auto()
     WEST = auto()
 
-    @staticmethod
-    def from_coords(c1: Point, c2: Point) -> "Direction":
-        x1, y1 = c1
-        x2, y2 = c2
-
-        if x1 > x2 and y1 == y2:
-            return Direction.WEST
-        if x1 < x2 and y1 == y2:
-            return Direction.EAST
-        if x1 == x2 and y1 > y2:
-            return Direction.NORTH
-        if x1 == x2 and y1 < y2:
-            return Direction.SOUTH
-
-        raise ValueError("cant determine direction of points")
-
 
 # Assume the inside is on the right (this might not be the case for all inputs)
 def get_possible_inside_right(
     point: Point, direction: Direction, data: Grid
 ) -> list[Point]:
     x, y = point
-    value = data[y][x]
+    value = chr(data.cells[y * data.width + x])
     if value == "-":
         if direction == Direction.EAST:
             return [(x - 1, y + 1), (x, y + 1), (x + 1, y + 1)]
@@ -225,72 +188,92 @@ def get_possible_inside_right(
     raise ValueError(f"unknown tile {value}")
 
 
-def main() -> None:
-    ##########
-    # Part 1 #
-    ##########
-    data = parse_data("input.txt")
-
-    previous_position = get_start_point(data)
-    next_positions = get_from_start(previous_position, data)
+def walk_tunnel(data: Grid) -> Iterator[int]:
+    """Flat cell indexes of the tunnel in walking order, from the start until
+    just before getting back to it."""
+    cells, width = data.cells, data.width
+    start_x, start_y = get_start_point(data)
+    next_positions = get_from_start((start_x, start_y), data)
 
     assert len(next_positions) == 2
-    current_position = next_positions[
-        0
-    ]  # just pick one direction, we will hopefully loop around
+    x, y = next_positions[0]  # just pick one direction, we will hopefully loop around
 
-    all_tunnel_coordinates = {previous_position, current_position}
-    while not is_start(current_position, data):
-        next_positions = get_next_points(current_position, data)
-        next_positions.remove(previous_position)  # we dont want to go back
-        assert len(next_positions) == 1
+    # a step to a neighbour is an index offset
+    steps = {
+        shape: [(dy * width + dx, connects) for dx, dy, connects in connections]
+        for shape, connections in CONNECTIONS.items()
+    }
+    previous_index = start_y * width + start_x
+    current_index = y * width + x
 
-        previous_position = current_position
-        current_position = next_positions[0]
-        all_tunnel_coordinates.add(current_position)
+    yield previous_index
+    while cells[current_index] != START_CELL:
+        yield current_index
 
-    assert len(all_tunnel_coordinates) % 2 == 0
-    result = len(all_tunnel_coordinates) // 2
-    print(result)
-    assert result == 6890
+        if cells[current_index] not in steps:
+            raise RuntimeError(f"not a recognized shape {chr(cells[current_index])}")
+        (step, connects), (other_step, other_connects) = steps[cells[current_index]]
+        if current_index + step == previous_index:  # we dont want to go back
+            step, connects = other_step, other_connects
+        else:
+            assert current_index + other_step == previous_index
 
-    ##########
-    # Part 2 #
-    ##########
+        previous_index = current_index
+        current_index += step
+        assert cells[current_index] in connects
 
-    clean_copy = create_clean_copy(data, all_tunnel_coordinates)
 
-    previous_position = get_start_point(clean_copy)
+def get_tunnel_coordinates(data: Grid) -> set[Point]:
+    return {(i % data.width, i // data.width) for i in walk_tunnel(data)}
 
-    next_positions = get_from_start(previous_position, clean_copy)
-    assert len(next_positions) == 2
-    current_position = next_positions[0]
 
-    while not is_start(current_position, clean_copy):
-        direction = Direction.from_coords(previous_position, current_position)
+def part_1(data: Grid) -> int:
+    all_tunnel_coordinates = get_tunnel_coordinates(data)
+
+    assert len(all_tunnel_coordinates) % 2 == 0
+    return len(all_tunnel_coordinates) // 2
+
+
+def part_2(data: Grid) -> int:
+    clean_copy = create_clean_copy(data, get_tunnel_coordinates(data))
+
+    width = clean_copy.width
+    directions = {
+        -1: Direction.WEST,
+        1: Direction.EAST,
+        -width: Direction.NORTH,
+        width: Direction.SOUTH,
+    }
+    for previous_index, current_index in pairwise(walk_tunnel(clean_copy)):
+        direction = directions[current_index - previous_index]
 
         possible_inside = get_possible_inside_right(
-            current_position, direction, clean_copy
+            (current_index % width, current_index // width), direction, clean_copy
         )
 
-        for x, y in possible_inside:
-            if clean_copy[y][x] is None:
-                fill_inside((x, y), clean_copy)
+        for px, py in possible_inside:
+            if clean_copy.cells[py * width + px] == EMPTY_CELL:
+                fill_inside((px, py), clean_copy)
 
-        next_positions = get_next_points(current_position, clean_copy)
-        next_positions.remove(previous_position)
+    return clean_copy.count("I")
 
-        assert len(next_positions) == 1
 
-        previous_position = current_position
-        current_position = next_positions[0]
+def main() -> None:
+    data = parse_data(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
 
-    inside_area = 0
-    for row in clean_copy:
-        for v in row:
-            if v == "I":
-                inside_area += 1
+    result = part_1(data)
+    print(result)
+    assert result == 6890
+
+    ##########
+    # Part 2 #
+    ##########
 
+    inside_area = part_2(data)
     print(inside_area)
     assert inside_area == 453
 
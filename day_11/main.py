@@ -13,41 +13,46 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-Point = tuple[int, int]
-Grid = list[list[str]]  # note only one char for each element
+import sys
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str) -> Grid:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.grid import Grid, Point
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
+GALAXY = ord("#")
 
-    grid: Grid = list(list(c for c in line) for line in lines)
 
-    return grid
+def parse_data(filename: str | Path) -> Grid:
+    return Grid.from_lines(read_lines(filename))
+
+
+def dump_parsed(data: Grid) -> bytes:
+    return data.to_bytes()
+
+
+def load_parsed(blob: bytes) -> Grid:
+    return Grid.from_bytes(blob)
 
 
 def get_expansion_slices(data: Grid) -> tuple[list[int], list[int]]:
     rows_to_expand = []
     cols_to_expand = []
-    for y, row in enumerate(data):
-        if all(v == "." for v in row):
+    for y in range(data.height):
+        if GALAXY not in data.row(y):
             rows_to_expand.append(y)
 
-    for x, _ in enumerate(data[0]):
-        if all(row[x] == "." for row in data):
+    for x in range(data.width):
+        if GALAXY not in data.column(x):
             cols_to_expand.append(x)
     return cols_to_expand, rows_to_expand
 
 
 def get_points(data: Grid) -> list[Point]:
-    points = []
-    for y, row in enumerate(data):
-        for x, v in enumerate(row):
-            if v == "#":
-                points.append((x, y))
-    return points
+    return list(data.find_all("#"))
 
 
 def get_distance_sum(
@@ -83,16 +88,27 @@ def get_distance_sum(
     return distance
 
 
-def main() -> None:
-    data = parse_data("input.txt")
+def part_1(data: Grid) -> int:
+    points = get_points(data)
+    cols, rows = get_expansion_slices(data)
 
+    return get_distance_sum(points, cols, rows, 2)
+
+
+def part_2(data: Grid) -> int:
     points = get_points(data)
     cols, rows = get_expansion_slices(data)
 
-    distance = get_distance_sum(points, cols, rows, 2)
+    return get_distance_sum(points, cols, rows, 1000000)
+
+
+def main() -> None:
+    data = parse_data(Path(__file__).with_name("input.txt"))
+
+    distance = part_1(data)
     assert distance == 9681886
 
-    distance = get_distance_sum(points, cols, rows, 1000000)
+    distance = part_2(data)
     assert distance == 791134099634
 
 
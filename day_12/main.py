@@ -14,23 +14,26 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import functools
+import sys
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def parse_data(filename: str) -> list[tuple[str, tuple[int, ...]]]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
+def parse_data(filename: str | Path) -> list[tuple[str, tuple[int, ...]]]:
     maps = []
-    for line in lines:
+    for line in read_lines(filename):
         map, damaged_spring_counts_str = line.split()
         damaged_spring_counts = tuple(
-            int(c) for c in damaged_spring_counts_str.split(",")
+            int(c) for c in damaged_spring_counts_str.split(b",")
         )
         maps.append(
             (
-                map,
+                map.decode(),
                 damaged_spring_counts,
             )
         )
@@ -89,24 +92,32 @@ def get_permutations(map: str, dmg_counts: tuple[int, ...]) -> int:
     return count
 
 
+def part_1(maps: list[tuple[str, tuple[int, ...]]]) -> int:
+    counts = [get_permutations(map, dmg_counts) for map, dmg_counts in maps]
+    return sum(counts)
+
+
+def part_2(maps: list[tuple[str, tuple[int, ...]]]) -> int:
+    maps = fold_up(maps)
+
+    counts = [get_permutations(map, dmg_counts) for map, dmg_counts in maps]
+    return sum(counts)
+
+
 def main() -> None:
-    maps = parse_data("input.txt")
+    maps = parse_data(Path(__file__).with_name("input.txt"))
 
     ##########
     # Part 1 #
     ##########
 
-    counts = [get_permutations(map, dmg_counts) for map, dmg_counts in maps]
-    assert sum(counts) == 7236
+    assert part_1(maps) == 7236
 
     ##########
     # Part 2 #
     ##########
 
-    maps = fold_up(maps)
-
-    counts = [get_permutations(map, dmg_counts) for map, dmg_counts in maps]
-    assert sum(counts) == 11607695322318
+    assert part_2(maps) == 11607695322318
 
 
 if __name__ == "__main__":
@@ -13,23 +13,27 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-Grid = list[str]
+import sys
+from pathlib import Path
+
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from aoc.reader import read_lines
 
-def parse_data(filename: str) -> list[Grid]:
-    with open(filename) as f:
-        lines = f.readlines()
+Grid = list[str]
 
-    lines = [line.strip() for line in lines]
 
+def parse_data(filename: str | Path) -> list[Grid]:
     result = []
     current: list[str] = []
-    for line in lines:
+    for line in read_lines(filename):
         if not line:
             result.append(current)
             current = []
         else:
-            current.append(line)
+            current.append(line.decode())
     result.append(current)
 
     return result
@@ -59,13 +63,7 @@ def find_reflects_horizontal_smudge(grid: Grid) -> int:
     return 0
 
 
-def main() -> None:
-    data = parse_data("input.txt")
-
-    ##########
-    # Part 1 #
-    ##########
-
+def part_1(data: list[Grid]) -> int:
     result = 0
     for grid in data:
         horizontal = find_reflects_horizontal(grid)
@@ -75,12 +73,10 @@ def main() -> None:
             vertical = find_reflects_horizontal(transpose(grid))
             result += vertical
 
-    assert result == 32371
+    return result
 
-    ##########
-    # Part 2 #
-    ##########
 
+def part_2(data: list[Grid]) -> int:
     result = 0
     for grid in data:
         horizontal = find_reflects_horizontal_smudge(grid)
@@ -90,7 +86,23 @@ def main() -> None:
             vertical = find_reflects_horizontal_smudge(transpose(grid))
             result += vertical
 
-    assert result == 37416
+    return result
+
+
+def main() -> None:
+    data = parse_data(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
+
+    assert part_1(data) == 32371
+
+    ##########
+    # Part 2 #
+    ##########
+
+    assert part_2(data) == 37416
 
 
 if __name__ == "__main__":
@@ -13,64 +13,71 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-Grid = list[list[str]]
+import sys
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def read_input(filename: str) -> Grid:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.grid import Grid
+from aoc.reader import read_lines
 
-    lines = [line.strip() for line in lines]
 
-    return list(list(c for c in line) for line in lines)
+def read_input(filename: str | Path) -> Grid:
+    return Grid.from_lines(read_lines(filename))
 
 
-def rotate_cw(grid: Grid) -> Grid:
-    return [list(row) for row in zip(*grid[::-1])]
+def dump_parsed(data: Grid) -> bytes:
+    return data.to_bytes()
+
+
+def load_parsed(blob: bytes) -> Grid:
+    return Grid.from_bytes(blob)
+
+
+EMPTY = ord(".")
+CUBE = ord("#")
+ROCK = ord("O")
 
 
 def tilt_north(grid: Grid) -> None:
-    for x, _ in enumerate(grid[0]):
+    cells = grid.cells
+    for x in range(grid.width):
         empty_place = None
-        for y, _ in enumerate(grid):
-            v = grid[y][x]
-            if v == ".":
+        # walk the column through the flat cells, one row is width cells
+        for i in range(x, len(cells), grid.width):
+            v = cells[i]
+            if v == EMPTY:
                 if empty_place is None:
-                    empty_place = y
-            elif v == "#":
+                    empty_place = i
+            elif v == CUBE:
                 empty_place = None
-            elif v == "O":
+            elif v == ROCK:
                 if empty_place is not None:
-                    grid[empty_place][x] = "O"
-                    grid[y][x] = "."
-                    empty_place += 1
+                    cells[empty_place] = ROCK
+                    cells[i] = EMPTY
+                    empty_place += grid.width
             else:
                 raise ValueError()
 
 
 def calc_load(grid: Grid) -> int:
     result = 0
-    for y, row in enumerate(grid):
-        for v in row:
-            if v == "O":
-                result += len(grid) - y
+    for y, row in enumerate(grid.rows()):
+        result += row.tobytes().count(b"O") * (grid.height - y)
     return result
 
 
-def main() -> None:
-    grid = read_input("input.txt")
-
-    ##########
-    # Part 1 #
-    ##########
+def part_1(grid: Grid) -> int:
+    grid = grid.copy()
 
     tilt_north(grid)
-    result = calc_load(grid)
-    assert result == 108955
+    return calc_load(grid)
 
-    ##########
-    # Part 2 #
-    ##########
+
+def part_2(grid: Grid) -> int:
+    grid = grid.copy()
 
     # Just try to find a repeating sequence. Nothing fancy here
 
@@ -81,7 +88,7 @@ def main() -> None:
         loads.append(load)
         for _ in range(4):
             tilt_north(grid)
-            grid = rotate_cw(grid)
+            grid = grid.rotate_cw()
 
     # Find first repeating sequence
     cycle = None
@@ -94,7 +101,24 @@ def main() -> None:
 
     assert cycle
 
-    result = right[(1000000000 - rotations) % cycle]
+    return right[(1000000000 - rotations) % cycle]
+
+
+def main() -> None:
+    grid = read_input(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
+
+    result = part_1(grid)
+    assert result == 108955
+
+    ##########
+    # Part 2 #
+    ##########
+
+    result = part_2(grid)
     assert result == 106689
 
 
@@ -13,14 +13,21 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def read_input(filename: str) -> list[str]:
-    with open(filename) as f:
-        lines = f.readlines()
+from aoc.reader import read_lines
 
-    return list(lines[0].split(","))
+
+def read_input(filename: str | Path) -> list[str]:
+    first_line = next(read_lines(filename))
+
+    return list(first_line.decode().split(","))
 
 
 def calc_hash(data: str) -> int:
@@ -53,20 +60,11 @@ class Lens:
         raise ValueError()
 
 
-def main() -> None:
-    data = read_input("input.txt")
+def part_1(data: list[str]) -> int:
+    return sum(calc_hash(d) for d in data)
 
-    ##########
-    # Part 1 #
-    ##########
-
-    result = sum(calc_hash(d) for d in data)
-    assert result == 513158
-
-    ##########
-    # Part 2 #
-    ##########
 
+def part_2(data: list[str]) -> int:
     boxes: list[list[Lens]] = [[] for _ in range(256)]
     for d in data:
         key, seperator, value = split_instruction(d)
@@ -92,6 +90,24 @@ def main() -> None:
         for slot_number, v in enumerate(box, 1):
             result += box_number * slot_number * v.focal_length
 
+    return result
+
+
+def main() -> None:
+    data = read_input(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
+
+    result = part_1(data)
+    assert result == 513158
+
+    ##########
+    # Part 2 #
+    ##########
+
+    result = part_2(data)
     assert result == 200277
 
 
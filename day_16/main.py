@@ -13,10 +13,19 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
+from pathlib import Path
 from typing import Generator
 
+if __name__ == "__main__" and not __package__:
+    # run as a script, make the packages in the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.grid import Grid, Point
+from aoc.reader import read_lines
+
 
 class Direction(Enum):
     NORTH = auto()
@@ -25,18 +34,19 @@ class Direction(Enum):
     WEST = auto()
 
 
-Grid = list[list[str]]
 HistoryGrid = list[list[list[Direction]]]
-Point = tuple[int, int]
 
 
-def read_input(filename: str) -> Grid:
-    with open(filename) as f:
-        lines = f.readlines()
+def read_input(filename: str | Path) -> Grid:
+    return Grid.from_lines(read_lines(filename))
+
+
+def dump_parsed(data: Grid) -> bytes:
+    return data.to_bytes()
 
-    lines = [line.strip() for line in lines]
 
-    return list(list(c for c in line) for line in lines)
+def load_parsed(blob: bytes) -> Grid:
+    return Grid.from_bytes(blob)
 
 
 @dataclass
@@ -69,14 +79,18 @@ def remove_out_of_bounds(beams: list[Beam], x_bound: int, y_bound: int) -> None:
         beams.remove(o)
 
 
+# tiles as raw cell bytes, the tick loop compares those
+HORIZONTAL_SPLITTER = ord("-")
+VERTICAL_SPLITTER = ord("|")
+
 MIRROR_DIRECTIONS = {
-    "/": {
+    ord("/"): {
         Direction.WEST: Direction.SOUTH,
         Direction.NORTH: Direction.EAST,
         Direction.EAST: Direction.NORTH,
         Direction.SOUTH: Direction.WEST,
     },
-    "\\": {
+    ord("\\"): {
         Direction.WEST: Direction.NORTH,
         Direction.NORTH: Direction.WEST,
         Direction.EAST: Direction.SOUTH,
@@ -91,19 +105,21 @@ def do_tick(grid: Grid, beams: list[Beam], history: HistoryGrid):
     for beam in beams:
         beam.move()
 
-    remove_out_of_bounds(beams, len(grid[0]), len(grid))
+    remove_out_of_bounds(beams, grid.width, grid.height)
 
     # Calc new beams and new directions
+    cells, width = grid.cells, grid.width
     for beam in beams:
         x, y = beam.coodinates
         d = beam.direction
-        if grid[y][x] in MIRROR_DIRECTIONS:
-            d = MIRROR_DIRECTIONS[grid[y][x]][d]
-        elif grid[y][x] == "-":
+        tile = cells[y * width + x]
+        if tile in MIRROR_DIRECTIONS:
+            d = MIRROR_DIRECTIONS[tile][d]
+        elif tile == HORIZONTAL_SPLITTER:
             if d in (Direction.NORTH, Direction.SOUTH):
                 d = Direction.WEST
                 new_beams.append(Beam((x, y), Direction.EAST))
-        elif grid[y][x] == "|":
+        elif tile == VERTICAL_SPLITTER:
             if d in (Direction.WEST, Direction.EAST):
                 d = Direction.NORTH
                 new_beams.append(Beam((x, y), Direction.SOUTH))
@@ -124,17 +140,17 @@ def do_tick(grid: Grid, beams: list[Beam], history: HistoryGrid):
 
 
 def get_all_start_points(grid: Grid) -> Generator[Beam, None, None]:
-    for y in range(len(grid)):
+    for y in range(grid.height):
         yield Beam((-1, y), Direction.EAST)
 
-    for y in range(len(grid)):
-        yield Beam((len(grid), y), Direction.WEST)
+    for y in range(grid.height):
+        yield Beam((grid.width, y), Direction.WEST)
 
-    for x in range(len(grid[0])):
+    for x in range(grid.width):
         yield Beam((x, -1), Direction.SOUTH)
 
-    for x in range(len(grid[0])):
-        yield Beam((x, len(grid[0])), Direction.NORTH)
+    for x in range(grid.width):
+        yield Beam((x, grid.height), Direction.NORTH)
 
 
 def calc_score(grid: HistoryGrid) -> int:
@@ -146,35 +162,44 @@ def calc_score(grid: HistoryGrid) -> int:
     return score
 
 
-def main() -> None:
-    data = read_input("input.txt")
-
-    ##########
-    # Part 1 #
-    ##########
-
-    history: HistoryGrid = [[[] for _ in row] for row in data]
+def part_1(data: Grid) -> int:
+    history: HistoryGrid = [[[] for _ in range(data.width)] for _ in range(data.height)]
     beams: list[Beam] = [Beam((-1, 0), Direction.EAST)]
     do_tick(data, beams, history)
 
     while beams:
         do_tick(data, beams, history)
 
-    result = calc_score(history)
-    assert result == 8021
+    return calc_score(history)
 
-    ##########
-    # Part 2 #
-    ##########
 
+def part_2(data: Grid) -> int:
     result = 0
     for b in get_all_start_points(data):
         beams = [b]
-        history = [[[] for _ in row] for row in data]
+        history = [[[] for _ in range(data.width)] for _ in range(data.height)]
         while beams:
             do_tick(data, beams, history)
         result = max(result, calc_score(history))
 
+    return result
+
+
+def main() -> None:
+    data = read_input(Path(__file__).with_name("input.txt"))
+
+    ##########
+    # Part 1 #
+    ##########
+
+    result = part_1(data)
+    assert result == 8021
+
+    ##########
+    # Part 2 #
+    ##########
+
+    result = part_2(data)
     assert result == 8216
 
 